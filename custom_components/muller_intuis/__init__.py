@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
-import time
-from datetime import timedelta
+from collections.abc import Mapping
 from typing import Any
 
-import aiohttp
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -17,54 +17,210 @@ from homeassistant.const import (
     CONF_USERNAME,
     Platform,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers import device_registry as dr
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, device_registry as dr, storage
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import (
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
 from .const import (
-    API_AUTH_URL,
-    API_HOMESDATA_URL,
-    API_HOMESTATUS_URL,
-    API_SETSTATE_URL,
-    API_SETTHERMMODE_URL,
-    API_SWITCHHOMESCHEDULE_URL,
+    ATTR_COMPARE_SCHEDULE_ID,
+    ATTR_HOME_ID,
+    ATTR_REFRESHES,
+    ATTR_SCHEDULE_ID,
+    ATTR_TIMETABLE,
+    ATTR_ZONES,
+    COMMAND_TIMEOUT_SECONDS,
+    CONF_COMMAND_TIMEOUT,
+    CONF_HOME_ID,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_RECORD_TRAFFIC,
+    CONF_REQUEST_TIMEOUT,
+    CONF_RETRY_ATTEMPTS,
+    CONF_RETRY_BACKOFF,
+    CONF_ROOM_GROUPS,
+    CONF_ROOMS,
+    CONF_TOKEN_REFRESH_MARGIN,
     DOMAIN,
-    OAUTH_GRANT_TYPE,
-    OAUTH_SCOPE,
-    OAUTH_USER_PREFIX,
-    SCAN_INTERVAL_SECONDS,
+    GLOBAL_MAX_CONCURRENT_REQUESTS,
+    LEGACY_TOKEN_STORAGE_KEY,
+    MAX_CONCURRENT_REQUESTS,
+    PROFILE_FILENAME,
+    REQUEST_TIMEOUT_SECONDS,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF_SECONDS,
+    SERVICE_ANALYZE_SCHEDULE,
+    SERVICE_PROFILE,
     TOKEN_REFRESH_MARGIN_SECONDS,
+    TOKEN_STORAGE_KEY,
+    TOKEN_STORAGE_VERSION,
+    TRAFFIC_RECORDING_FILENAME,
 )
+from .config_flow import account_id, home_unique_id
+from .coordinator import MullerIntuisDataUpdateCoordinator
+from .lib.intuis_core import MullerIntuisApiClient, TrafficRecorder
+from .lib.intuis_core.analysis import analyze_schedule, compare_analyses
+from .lib.intuis_core.schedule import active_schedule
+from .metrics import MullerIntuisMetricsView
+from .profiler import RefreshProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SENSOR, Platform.SELECT]
+PLATFORMS: list[Platform] = [
+    Platform.CLIMATE,
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+    Platform.SELECT,
+]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+DATA_PROFILER = f"{DOMAIN}_profiler"
+DATA_REQUEST_LIMITER = f"{DOMAIN}_request_limiter"
+DATA_ACCOUNTS = f"{DOMAIN}_accounts"  # account -> {"api_client", "entries"}
+DATA_ACCOUNTS_LOCK = f"{DOMAIN}_accounts_lock"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_REFRESHES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
+ANALYZE_SCHEDULE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_HOME_ID): cv.string,
+            vol.Optional(ATTR_SCHEDULE_ID): cv.string,
+            vol.Optional(ATTR_COMPARE_SCHEDULE_ID): cv.string,
+            # A draft schedule, in the format of the API (timetable and zones)
+            vol.Inclusive(ATTR_TIMETABLE, "draft"): [dict],
+            vol.Inclusive(ATTR_ZONES, "draft"): [dict],
+        }
+    ),
+    cv.has_at_most_one_key(ATTR_SCHEDULE_ID, ATTR_TIMETABLE),
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Muller Intuis Connect services."""
+    profiler = hass.data[DATA_PROFILER] = RefreshProfiler(hass)
+    # Every account shares Home Assistant's connection pool and this cap
+    hass.data[DATA_REQUEST_LIMITER] = asyncio.Semaphore(GLOBAL_MAX_CONCURRENT_REQUESTS)
+    # The homes of an account share one client, hence one token and one login
+    hass.data[DATA_ACCOUNTS] = {}
+    hass.data[DATA_ACCOUNTS_LOCK] = asyncio.Lock()
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the next refreshes, counted across every configured home."""
+        timestamp = dt_util.now().strftime("%Y%m%d_%H%M%S")
+        profiler.start(
+            call.data[ATTR_REFRESHES],
+            hass.config.path(PROFILE_FILENAME.format(timestamp=timestamp)),
+        )
+        for entry_data in hass.data.get(DOMAIN, {}).values():
+            await entry_data["coordinator"].async_request_refresh()
+
+    async def async_analyze_schedule(call: ServiceCall) -> ServiceResponse:
+        """Return the weekly setpoint hours of a schedule, optionally compared."""
+        coordinator = _find_coordinator(hass, call.data.get(ATTR_HOME_ID))
+        schedules = coordinator.homes_data.get("schedules", [])
+        room_names = {
+            room["id"]: room.get("name", room["id"])
+            for room in coordinator.homes_data.get("rooms", [])
+        }
+
+        if ATTR_TIMETABLE in call.data:
+            schedule = {
+                "name": "draft",
+                "timetable": call.data[ATTR_TIMETABLE],
+                "zones": call.data[ATTR_ZONES],
+            }
+        elif ATTR_SCHEDULE_ID in call.data:
+            schedule = _find_schedule(schedules, call.data[ATTR_SCHEDULE_ID])
+        else:
+            schedule = active_schedule(schedules)
+            if schedule is None:
+                raise HomeAssistantError("No active schedule")
+
+        try:
+            analysis = analyze_schedule(schedule, room_names)
+            response: dict[str, Any] = {"schedule": analysis}
+            if ATTR_COMPARE_SCHEDULE_ID in call.data:
+                other = analyze_schedule(
+                    _find_schedule(schedules, call.data[ATTR_COMPARE_SCHEDULE_ID]), room_names
+                )
+                response["compare"] = other
+                response["difference"] = compare_analyses(other, analysis)
+        except (KeyError, TypeError) as err:
+            raise HomeAssistantError(f"Invalid schedule: {err}") from err
+        return response
+
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ANALYZE_SCHEDULE,
+        async_analyze_schedule,
+        schema=ANALYZE_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.http.register_view(MullerIntuisMetricsView(hass))
+    return True
+
+
+def _find_coordinator(
+    hass: HomeAssistant, home_id: str | None
+) -> MullerIntuisDataUpdateCoordinator:
+    """Return the coordinator of ``home_id``, or the only one when unset."""
+    coordinators = [
+        entry_data["coordinator"] for entry_data in hass.data.get(DOMAIN, {}).values()
+    ]
+    if home_id is None:
+        if len(coordinators) != 1:
+            raise HomeAssistantError(f"{len(coordinators)} homes configured, set {ATTR_HOME_ID}")
+        return coordinators[0]
+    for coordinator in coordinators:
+        if coordinator.home_id == home_id:
+            return coordinator
+    raise HomeAssistantError(f"Home {home_id} is not configured")
+
+
+def _find_schedule(schedules: list[dict[str, Any]], schedule_id: str) -> dict[str, Any]:
+    """Return the schedule with ``schedule_id``."""
+    for schedule in schedules:
+        if schedule.get("id") == schedule_id:
+            return schedule
+    raise HomeAssistantError(f"Schedule {schedule_id} not found")
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Muller Intuis Connect from a config entry."""
     _LOGGER.info("Setting up Muller Intuis Connect integration")
     hass.data.setdefault(DOMAIN, {})
+    api_client = await _async_acquire_account_client(hass, entry)
 
     try:
-        api_client = MullerIntuisApiClient(
+        _apply_client_options(api_client, entry.options)
+        await _async_configure_recorder(hass, entry, api_client)
+
+        coordinator = MullerIntuisDataUpdateCoordinator(
             hass,
-            entry.data[CONF_CLIENT_ID],
-            entry.data[CONF_CLIENT_SECRET],
-            entry.data[CONF_USERNAME],
-            entry.data[CONF_PASSWORD],
-            entry.data.get("access_token"),
-            entry.data.get("refresh_token_value"),
+            api_client,
+            home_id=entry.data.get(CONF_HOME_ID),
+            room_ids=entry.options.get(CONF_ROOMS),
+            profiler=hass.data[DATA_PROFILER],
         )
-
-        coordinator = MullerIntuisDataUpdateCoordinator(hass, api_client)
+        coordinator.apply_options(entry.options)
         await coordinator.async_config_entry_first_refresh()
 
+        unique_id = home_unique_id(entry.data[CONF_USERNAME], coordinator.home_id)
+        if entry.unique_id != unique_id:
+            # Entries created before the per-home unique id used the account
+            _LOGGER.info("Migrating unique id of %s to %s", entry.title, unique_id)
+            hass.config_entries.async_update_entry(entry, unique_id=unique_id)
+
         # Create the home device FIRST to avoid via_device warning
         device_registry = dr.async_get(hass)
         device_registry.async_get_or_create(
@@ -76,18 +232,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         _LOGGER.info("Created home device: %s", coordinator.home_name)
 
+        if coordinator.room_ids is not None:
+            _async_remove_excluded_room_devices(hass, entry, coordinator.room_ids)
+
         hass.data[DOMAIN][entry.entry_id] = {
             "coordinator": coordinator,
             "api_client": api_client,
+            "room_groups": entry.options.get(CONF_ROOM_GROUPS, []),
         }
 
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        entry.async_on_unload(entry.add_update_listener(async_update_options))
         _LOGGER.info("Muller Intuis Connect setup completed")
 
         return True
     
     except Exception as err:
         _LOGGER.exception("Error setting up Muller Intuis Connect: %s", err)
+        await _async_release_account_client(hass, entry)
         raise
 
 
@@ -95,343 +257,170 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        await _async_release_account_client(hass, entry)
 
     return unload_ok
 
 
-class MullerIntuisApiClient:
-    """API client for Muller Intuitiv."""
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        client_id: str,
-        client_secret: str,
-        username: str,
-        password: str,
-        access_token: str | None = None,
-        refresh_token_value: str | None = None,
-    ) -> None:
-        """Initialize the API client."""
-        self.hass = hass
-        self.session = async_get_clientsession(hass)
-        self.client_id = client_id
-        self.client_secret = client_secret
-        self.username = username
-        self.password = password
-        self._access_token = access_token
-        self._refresh_token_value = refresh_token_value
-        self._token_expires_at = 0
-
-    async def _refresh_token(self) -> None:
-        """Refresh the access token."""
-        auth_data = {
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "username": self.username,
-            "password": self.password,
-            "grant_type": OAUTH_GRANT_TYPE,
-            "user_prefix": OAUTH_USER_PREFIX,
-            "scope": OAUTH_SCOPE,
-        }
-
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-
-        try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with self.session.post(
-                API_AUTH_URL,
-                data=auth_data,
-                headers=headers,
-                timeout=timeout,
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    _LOGGER.error("Token refresh failed: %s - %s", response.status, error_text)
-                    raise ConfigEntryAuthFailed("Token refresh failed")
-
-                data = await response.json()
-
-                if "access_token" not in data:
-                    raise ConfigEntryAuthFailed("No access_token in response")
-
-                self._access_token = data["access_token"]
-                self._refresh_token_value = data.get("refresh_token", self._refresh_token_value)
-                
-                expires_in = data.get("expires_in", 10800)
-                self._token_expires_at = time.time() + expires_in
-
-                _LOGGER.info("Token refreshed successfully")
-
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Connection error during token refresh: %s", err)
-            raise UpdateFailed(f"Connection error: {err}") from err
-
-    async def _ensure_token_valid(self) -> None:
-        """Ensure the access token is valid."""
-        if (
-            not self._access_token
-            or time.time() >= (self._token_expires_at - TOKEN_REFRESH_MARGIN_SECONDS)
-        ):
-            await self._refresh_token()
-
-    async def _api_request(
-        self, url: str, method: str = "POST", data: dict | None = None
-    ) -> dict[str, Any]:
-        """Make an API request."""
-        await self._ensure_token_valid()
-
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-        }
-        
-        if method == "POST_JSON":
-            headers["Content-Type"] = "application/json"
-            method = "POST"
-            request_data = data
-        else:
-            headers["Content-Type"] = "application/x-www-form-urlencoded"
-            request_data = data
-
-        try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            if method == "GET":
-                async with self.session.get(url, headers=headers, params=data, timeout=timeout) as response:
-                    return await self._handle_response(response)
-            else:
-                if headers["Content-Type"] == "application/json":
-                    async with self.session.post(url, headers=headers, json=request_data, timeout=timeout) as response:
-                        return await self._handle_response(response)
-                else:
-                    async with self.session.post(url, headers=headers, data=request_data, timeout=timeout) as response:
-                        return await self._handle_response(response)
-
-        except aiohttp.ClientError as err:
-            _LOGGER.error("API request error: %s", err)
-            raise UpdateFailed(f"API request failed: {err}") from err
-
-    async def _handle_response(self, response: aiohttp.ClientResponse) -> dict[str, Any]:
-        """Handle API response."""
-        if response.status == 401:
-            self._access_token = None
-            raise ConfigEntryAuthFailed("Authentication failed")
-
-        if response.status != 200:
-            error_text = await response.text()
-            _LOGGER.error("API error: %s - %s", response.status, error_text)
-            raise UpdateFailed(f"API error: {response.status}")
-
-        data = await response.json()
-        
-        if data.get("status") != "ok":
-            error = data.get("error", {})
-            error_msg = error.get("message", "Unknown error")
-            _LOGGER.error("API returned error: %s", error_msg)
-            raise UpdateFailed(f"API error: {error_msg}")
-
-        return data
-
-    async def get_homes_data(self) -> dict[str, Any]:
-        """Get homes data (static info: rooms, modules, schedules)."""
-        return await self._api_request(API_HOMESDATA_URL, method="GET")
-
-    async def get_home_status(self, home_id: str) -> dict[str, Any]:
-        """Get home status (real-time: temperatures, states)."""
-        return await self._api_request(
-            API_HOMESTATUS_URL,
-            method="GET",
-            data={"home_id": home_id},
-        )
-
-    async def set_room_state(
-        self, home_id: str, room_id: str, mode: str, temp: float | None = None, duration: int | None = None
-    ) -> dict[str, Any]:
-        """Set room state (temperature setpoint and mode)."""
-        _LOGGER.debug("Setting room state: home=%s, room=%s, mode=%s, temp=%s, duration=%s", 
-                     home_id, room_id, mode, temp, duration)
-        
-        room_data = {
-            "id": room_id,
-            "therm_setpoint_mode": mode,
-        }
-        
-        if temp is not None:
-            room_data["therm_setpoint_temperature"] = temp
-            
-        if duration is not None:
-            if duration == 0:
-                room_data["therm_setpoint_end_time"] = 0
-            else:
-                end_time = int(time.time()) + (duration * 60)
-                room_data["therm_setpoint_end_time"] = end_time
-        
-        payload = {
-            "home": {
-                "id": home_id,
-                "rooms": [room_data]
-            }
-        }
-
-        return await self._api_request(API_SETSTATE_URL, data=payload, method="POST_JSON")
-
-    async def set_all_rooms_off(self, home_id: str, rooms: list[dict]) -> dict[str, Any]:
-        """Set all rooms to OFF mode."""
-        _LOGGER.debug("Setting ALL rooms to OFF for home %s (%d rooms)", home_id, len(rooms))
-        
-        rooms_data = []
-        for room in rooms:
-            room_id = room.get("id")
-            if room_id:
-                rooms_data.append({
-                    "id": room_id,
-                    "therm_setpoint_mode": "off",
-                })
-        
-        if not rooms_data:
-            _LOGGER.warning("No rooms to set OFF")
-            return {"status": "ok"}
-        
-        payload = {
-            "home": {
-                "id": home_id,
-                "rooms": rooms_data
-            }
-        }
-        
-        _LOGGER.info("Sending OFF command to %d rooms", len(rooms_data))
-        return await self._api_request(API_SETSTATE_URL, data=payload, method="POST_JSON")
-    
-    async def set_all_rooms_mode(self, home_id: str, rooms: list[dict], mode: str) -> dict[str, Any]:
-        """Set all rooms to a specific mode."""
-        _LOGGER.debug("Setting ALL rooms to mode %s for home %s (%d rooms)", mode, home_id, len(rooms))
-        
-        rooms_data = []
-        for room in rooms:
-            room_id = room.get("id")
-            if room_id:
-                rooms_data.append({
-                    "id": room_id,
-                    "therm_setpoint_mode": mode,
-                })
-        
-        if not rooms_data:
-            _LOGGER.warning("No rooms to set to mode %s", mode)
-            return {"status": "ok"}
-        
-        payload = {
-            "home": {
-                "id": home_id,
-                "rooms": rooms_data
-            }
-        }
-        
-        _LOGGER.info("Sending mode %s command to %d rooms", mode, len(rooms_data))
-        return await self._api_request(API_SETSTATE_URL, data=payload, method="POST_JSON")
-
-    async def set_therm_mode(
-        self, home_id: str, mode: str, end_time: int | None = None
-    ) -> dict[str, Any]:
-        """Set home thermostat mode."""
-        
-        # Validation endtime : ne pas envoyer si None, sinon vérifier validité
-        if end_time is not None and end_time != 0:
-            now = int(time.time())
-            min_time = now + 300  # 5 minutes dans le futur minimum
-            
-            if end_time < min_time:
-                _LOGGER.warning(
-                    "endtime %s is in the past or too soon, removing it (permanent mode)",
-                    end_time
-                )
-                end_time = None  # Mode permanent
-        elif end_time == 0:
-            # endtime=0 signifie permanent, ne pas l'envoyer
-            _LOGGER.debug("endtime=0 detected, removing it (permanent mode)")
-            end_time = None
-        
-        _LOGGER.debug("Setting home therm mode: home=%s, mode=%s, endtime=%s", home_id, mode, end_time)
-        
-        data = {
-            "home_id": home_id,
-            "mode": mode,
-        }
-        
-        if end_time is not None:
-            data["endtime"] = end_time
-
-        return await self._api_request(API_SETTHERMMODE_URL, data=data)
-
-    async def switch_home_schedule(
-        self, home_id: str, schedule_id: str
-    ) -> dict[str, Any]:
-        """Switch the active home schedule."""
-        _LOGGER.debug("Switching home schedule: home=%s, schedule=%s", home_id, schedule_id)
-        
-        payload = {
-            "app_identifier": "app_muller",
-            "home_id": home_id,
-            "schedule_id": schedule_id,
-            "schedule_type": "therm"
-        }
-
-        return await self._api_request(API_SWITCHHOMESCHEDULE_URL, data=payload, method="POST_JSON")
-
-
-class MullerIntuisDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Muller Intuis data."""
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        api_client: MullerIntuisApiClient,
-    ) -> None:
-        """Initialize."""
-        self.api_client = api_client
-        self.home_id: str | None = None
-        self.home_name: str | None = None
-        self.homes_data: dict[str, Any] = {}
-
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=SCAN_INTERVAL_SECONDS),
-        )
-
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via library."""
-        try:
-            if not self.home_id:
-                homes_response = await self.api_client.get_homes_data()
-                homes = homes_response.get("body", {}).get("homes", [])
-                
-                if not homes:
-                    raise UpdateFailed("No homes found in account")
-                
-                self.home_id = homes[0]["id"]
-                self.home_name = homes[0].get("name", "Domicile")
-                self.homes_data = homes[0]
-                _LOGGER.info("Using home: %s (ID: %s) with %d rooms", 
-                            self.home_name, self.home_id, len(self.homes_data.get("rooms", [])))
-
-            status_data = await self.api_client.get_home_status(self.home_id)
-            status = status_data.get("body", {}).get("home", {})
-            
-            status["rooms_info"] = self.homes_data.get("rooms", [])
-            status["schedules"] = self.homes_data.get("schedules", [])
-            status["home_name"] = self.home_name
-            
-            return {
-                "home_id": self.home_id,
-                "home_name": self.home_name,
-                "status": status,
-                "homes_data": self.homes_data,
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the tokens of a deleted entry's account, unless another home uses them."""
+    account = account_id(entry.data[CONF_USERNAME])
+    if not any(
+        other.entry_id != entry.entry_id and account_id(other.data[CONF_USERNAME]) == account
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        await _token_store(hass, account).async_remove()
+    await _legacy_token_store(hass, entry).async_remove()
+
+
+def _token_store(hass: HomeAssistant, account: str) -> storage.Store:
+    """Return the token store of ``account``; the file name does not reveal the email."""
+    digest = hashlib.sha256(account.encode()).hexdigest()[:16]
+    return storage.Store(hass, TOKEN_STORAGE_VERSION, TOKEN_STORAGE_KEY.format(account=digest))
+
+
+def _legacy_token_store(hass: HomeAssistant, entry: ConfigEntry) -> storage.Store:
+    """Return the per-entry token store used before accounts shared their tokens."""
+    return storage.Store(
+        hass, TOKEN_STORAGE_VERSION, LEGACY_TOKEN_STORAGE_KEY.format(entry_id=entry.entry_id)
+    )
+
+
+async def _async_acquire_account_client(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> MullerIntuisApiClient:
+    """Return the API client of ``entry``'s account, creating it for its first home.
+
+    Every home of an account shares the client, so its token, its logins and
+    its request concurrency; release it with ``_async_release_account_client``.
+    """
+    account = account_id(entry.data[CONF_USERNAME])
+    store = _token_store(hass, account)
+    async with hass.data[DATA_ACCOUNTS_LOCK]:
+        legacy_store = _legacy_token_store(hass, entry)
+        if (legacy_tokens := await legacy_store.async_load()) is not None:
+            if await store.async_load() is None:
+                await store.async_save(legacy_tokens)
+            await legacy_store.async_remove()
+
+        shared = hass.data[DATA_ACCOUNTS].get(account)
+        if shared is None:
+            api_client = MullerIntuisApiClient(
+                async_get_clientsession(hass),
+                entry.data[CONF_CLIENT_ID],
+                entry.data[CONF_CLIENT_SECRET],
+                entry.data[CONF_USERNAME],
+                entry.data[CONF_PASSWORD],
+                entry.data.get("access_token"),
+                entry.data.get("refresh_token_value"),
+                token_store=store,
+                request_limiter=hass.data[DATA_REQUEST_LIMITER],
+            )
+            await api_client.async_load_tokens()
+            shared = hass.data[DATA_ACCOUNTS][account] = {
+                "api_client": api_client,
+                "entries": set(),
             }
-
-        except ConfigEntryAuthFailed as err:
-            raise err
-        except Exception as err:
-            _LOGGER.exception("Error communicating with API: %s", err)
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+        else:
+            # A reauthenticated entry is reloaded with the new password
+            shared["api_client"].update_credentials(
+                entry.data[CONF_CLIENT_ID], entry.data[CONF_CLIENT_SECRET], entry.data[CONF_PASSWORD]
+            )
+        shared["entries"].add(entry.entry_id)
+        return shared["api_client"]
+
+
+async def _async_release_account_client(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Release ``entry``'s use of its account client, dropping it after the last home."""
+    account = account_id(entry.data[CONF_USERNAME])
+    shared = hass.data[DATA_ACCOUNTS].get(account)
+    if shared is None:
+        return
+    shared["entries"].discard(entry.entry_id)
+    if shared["entries"]:
+        return
+    del hass.data[DATA_ACCOUNTS][account]
+    if (recorder := shared["api_client"].recorder) is not None:
+        await recorder.async_close()
+
+
+def _apply_client_options(api_client: MullerIntuisApiClient, options: Mapping[str, Any]) -> None:
+    """Apply the entry's tuning options to the API client.
+
+    The homes of an account share the client: the entry set up or changed
+    last sets them.
+    """
+    api_client.configure(
+        token_refresh_margin=options.get(CONF_TOKEN_REFRESH_MARGIN, TOKEN_REFRESH_MARGIN_SECONDS),
+        request_timeout=options.get(CONF_REQUEST_TIMEOUT, REQUEST_TIMEOUT_SECONDS),
+        command_timeout=options.get(CONF_COMMAND_TIMEOUT, COMMAND_TIMEOUT_SECONDS),
+        retry_attempts=options.get(CONF_RETRY_ATTEMPTS, RETRY_ATTEMPTS),
+        retry_backoff=options.get(CONF_RETRY_BACKOFF, RETRY_BACKOFF_SECONDS),
+        max_concurrent=options.get(CONF_MAX_CONCURRENT_REQUESTS, MAX_CONCURRENT_REQUESTS),
+    )
+
+
+async def _async_configure_recorder(
+    hass: HomeAssistant, entry: ConfigEntry, api_client: MullerIntuisApiClient
+) -> None:
+    """Start or stop recording API traffic according to the entry options.
+
+    The client, hence the recording, is shared by the homes of the account:
+    it records while any of them has the option enabled.
+    """
+    shared = hass.data[DATA_ACCOUNTS][account_id(entry.data[CONF_USERNAME])]
+    enabled = any(
+        (other := hass.config_entries.async_get_entry(entry_id)) is not None
+        and other.options.get(CONF_RECORD_TRAFFIC, False)
+        for entry_id in shared["entries"]
+    )
+    if enabled == (api_client.recorder is not None):
+        return
+
+    if enabled:
+        path = hass.config.path(TRAFFIC_RECORDING_FILENAME.format(entry_id=entry.entry_id))
+        api_client.recorder = TrafficRecorder(path)
+        _LOGGER.info("Recording API traffic to %s", path)
+    else:
+        recorder, api_client.recorder = api_client.recorder, None
+        await recorder.async_close()
+        _LOGGER.info("Stopped recording API traffic")
+
+
+def _async_remove_excluded_room_devices(
+    hass: HomeAssistant, entry: ConfigEntry, room_ids: set[str]
+) -> None:
+    """Remove devices (and their entities) of rooms outside the configured scope."""
+    device_registry = dr.async_get(hass)
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        for domain, identifier in device.identifiers:
+            if domain == DOMAIN and not identifier.endswith("_home") and identifier not in room_ids:
+                _LOGGER.info("Removing device of excluded room: %s", device.name)
+                device_registry.async_remove_device(device.id)
+                break
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated options to the running client and coordinator."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: MullerIntuisDataUpdateCoordinator = entry_data["coordinator"]
+    previous_intervals = (coordinator.scan_interval, coordinator.min_scan_interval)
+
+    room_ids = entry.options.get(CONF_ROOMS)
+    if (
+        (set(room_ids) if room_ids is not None else None) != coordinator.room_ids
+        or entry.options.get(CONF_ROOM_GROUPS, []) != entry_data["room_groups"]
+    ):
+        # The entity set changes with the scope and groups: reload instead of patching live
+        _LOGGER.info("Room scope or groups changed, reloading entry")
+        hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+        return
+
+    _apply_client_options(entry_data["api_client"], entry.options)
+    await _async_configure_recorder(hass, entry, entry_data["api_client"])
+    coordinator.apply_options(entry.options)
+    _LOGGER.info("Options updated: %s", dict(entry.options))
+
+    if (coordinator.scan_interval, coordinator.min_scan_interval) != previous_intervals:
+        # Refresh now so the next poll is scheduled with the new interval
+        await coordinator.async_request_refresh()
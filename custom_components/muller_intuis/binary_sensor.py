@@ -0,0 +1,133 @@
+"""Binary sensor platform for Muller Intuis Connect."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Muller Intuis binary sensor platform."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    entities = []
+
+    status = coordinator.data.get("status", {})
+    rooms_status = status.get("rooms", [])
+    rooms_info = status.get("rooms_info", [])
+
+    rooms_map = {room["id"]: room for room in rooms_info}
+
+    for room_status in rooms_status:
+        room_id = room_status.get("id")
+        room_info = rooms_map.get(room_id, {})
+        room_data = {**room_info, **room_status}
+
+        entities.append(MullerIntuisOpenWindowSensor(coordinator, room_data))
+        entities.append(MullerIntuisAnticipatingSensor(coordinator, room_data))
+        entities.append(MullerIntuisReachableSensor(coordinator, room_data))
+
+    async_add_entities(entities)
+    _LOGGER.info("Binary sensor platform setup completed with %d entities", len(entities))
+
+
+class MullerIntuisBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
+    """Base class for Muller Intuis room binary sensors.
+
+    Each sensor mirrors one boolean field of the room status, so that a
+    change only records a row for this entity instead of a new state (and
+    attributes row) for the room climate entity.
+    """
+
+    _attr_has_entity_name = True
+    _field: str
+
+    def __init__(self, coordinator, room_data: dict[str, Any], sensor_type: str, name_suffix: str) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._room_id = room_data["id"]
+        self._room_name = room_data.get("name", "Unknown Room")
+        self._attr_unique_id = f"{self._room_id}_{sensor_type}"
+        self._attr_name = name_suffix
+        self._home_id = coordinator.home_id
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return {
+            "identifiers": {(DOMAIN, self._room_id)},
+            "name": self._room_name,
+            "manufacturer": "Muller Intuitiv",
+            "model": "Radiateur connecté",
+            "via_device": (DOMAIN, f"{self._home_id}_home"),
+        }
+
+    def _get_room_data(self) -> dict[str, Any] | None:
+        """Get current room data from coordinator."""
+        status = self.coordinator.data.get("status", {})
+        rooms = status.get("rooms", [])
+
+        for room in rooms:
+            if room.get("id") == self._room_id:
+                return room
+        return None
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return the value of the mirrored room field."""
+        room = self._get_room_data()
+        if room is None or self._field not in room:
+            return None
+        return bool(room[self._field])
+
+
+class MullerIntuisOpenWindowSensor(MullerIntuisBinarySensorBase):
+    """Open window detection of a room."""
+
+    _attr_device_class = BinarySensorDeviceClass.WINDOW
+    _field = "open_window"
+
+    def __init__(self, coordinator, room_data: dict[str, Any]) -> None:
+        """Initialize the open window sensor."""
+        super().__init__(coordinator, room_data, "open_window", "Fenêtre ouverte")
+
+
+class MullerIntuisAnticipatingSensor(MullerIntuisBinarySensorBase):
+    """Anticipation (early heating before a schedule change) of a room."""
+
+    _attr_device_class = BinarySensorDeviceClass.HEAT
+    _attr_icon = "mdi:clock-fast"
+    _field = "anticipating"
+
+    def __init__(self, coordinator, room_data: dict[str, Any]) -> None:
+        """Initialize the anticipation sensor."""
+        super().__init__(coordinator, room_data, "anticipating", "Anticipation")
+
+
+class MullerIntuisReachableSensor(MullerIntuisBinarySensorBase):
+    """Connectivity of a room's heaters."""
+
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _field = "reachable"
+
+    def __init__(self, coordinator, room_data: dict[str, Any]) -> None:
+        """Initialize the connectivity sensor."""
+        super().__init__(coordinator, room_data, "reachable", "Connectivité")
@@ -14,11 +14,13 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    CONF_ROOMS,
     DOMAIN,
     MODE_MANUAL,
     MODE_HOME,
@@ -27,8 +29,8 @@ from .const import (
     MODE_SCHEDULE,
     MODE_AWAY,
     MODE_HOME_HG,
-    DEFAULT_MANUAL_DURATION,
 )
+from .lib.intuis_core import IntuisError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,8 +64,31 @@ async def async_setup_entry(
         room_entity = MullerIntuisRoomClimate(coordinator, api_client, room_data)
         entities.append(room_entity)
     
+    # Add room group climate entities, on the home device
+    status_ids = {room.get("id") for room in rooms_status}
+    for group in hass.data[DOMAIN][entry.entry_id].get("room_groups", []):
+        room_ids = [room_id for room_id in group[CONF_ROOMS] if room_id in status_ids]
+        if not room_ids:
+            _LOGGER.warning("Room group %s has no room in scope, skipped", group["name"])
+            continue
+        entities.append(MullerIntuisRoomGroupClimate(coordinator, group, room_ids))
+
     async_add_entities(entities)
-    _LOGGER.info("Climate setup: 1 home + %d rooms = %d entities", len(rooms_status), len(entities))
+    _LOGGER.info(
+        "Climate setup: 1 home + %d rooms + %d room groups = %d entities",
+        len(rooms_status),
+        len(entities) - 1 - len(rooms_status),
+        len(entities),
+    )
+
+
+def _room_hvac_mode(setpoint_mode: str | None) -> HVACMode:
+    """Map a room setpoint mode to an HVAC mode."""
+    if setpoint_mode == MODE_MANUAL:
+        return HVACMode.HEAT
+    if setpoint_mode in (MODE_OFF, MODE_HG):
+        return HVACMode.OFF
+    return HVACMode.AUTO
 
 
 class MullerIntuisHomeClimate(CoordinatorEntity, ClimateEntity):
@@ -147,54 +172,39 @@ class MullerIntuisHomeClimate(CoordinatorEntity, ClimateEntity):
         _LOGGER.info("Setting home HVAC mode to %s", hvac_mode)
         
         try:
-            status = self.coordinator.data.get("status", {})
-            rooms = status.get("rooms", [])
-            
             if hvac_mode == HVACMode.AUTO:
                 # Auto = Schedule mode + remettre les pièces en mode home
-                await self.api_client.set_therm_mode(self._home_id, MODE_SCHEDULE)
-                await self.api_client.set_all_rooms_mode(self._home_id, rooms, "home")
+                await self.coordinator.async_set_home_rooms_mode(MODE_HOME, MODE_SCHEDULE)
                 
             elif hvac_mode == HVACMode.HEAT:
                 # Heat = Away mode + remettre les pièces en mode home
-                await self.api_client.set_therm_mode(self._home_id, MODE_AWAY)
-                await self.api_client.set_all_rooms_mode(self._home_id, rooms, "home")
+                await self.coordinator.async_set_home_rooms_mode(MODE_HOME, MODE_AWAY)
                 
             elif hvac_mode == HVACMode.OFF:
                 # Off = Éteindre toutes les pièces
                 _LOGGER.info("Turning OFF all rooms")
-                await self.api_client.set_all_rooms_off(self._home_id, rooms)
-            
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+                await self.coordinator.async_set_home_rooms_mode(MODE_OFF)
+        except IntuisError as err:
             _LOGGER.error("Error setting home HVAC mode: %s", err)
-            raise
+            raise HomeAssistantError(f"Error setting home HVAC mode: {err}") from err
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
         _LOGGER.info("Setting home preset mode to %s", preset_mode)
         
         try:
-            status = self.coordinator.data.get("status", {})
-            rooms = status.get("rooms", [])
-            
             if preset_mode == PRESET_HOME:
                 # "schedule"
-                await self.api_client.set_therm_mode(self._home_id, MODE_SCHEDULE)
-                await self.api_client.set_all_rooms_mode(self._home_id, rooms, "home")
+                await self.coordinator.async_set_home_rooms_mode(MODE_HOME, MODE_SCHEDULE)
             elif preset_mode == PRESET_AWAY:
                 # "away" (sans endtime = permanent)
-                await self.api_client.set_therm_mode(self._home_id, MODE_AWAY)
-                await self.api_client.set_all_rooms_mode(self._home_id, rooms, "home")
+                await self.coordinator.async_set_home_rooms_mode(MODE_HOME, MODE_AWAY)
             elif preset_mode == "frost_protection":
                 # "hg" (hors-gel) + mettre toutes les pièces en hg
-                await self.api_client.set_therm_mode(self._home_id, MODE_HOME_HG)
-                await self.api_client.set_all_rooms_mode(self._home_id, rooms, "hg")
-            
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+                await self.coordinator.async_set_home_rooms_mode(MODE_HG, MODE_HOME_HG)
+        except IntuisError as err:
             _LOGGER.error("Error setting home preset mode: %s", err)
-            raise
+            raise HomeAssistantError(f"Error setting home preset mode: {err}") from err
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -206,11 +216,9 @@ class MullerIntuisHomeClimate(CoordinatorEntity, ClimateEntity):
             "therm_mode": status.get("therm_mode"),
         }
         
-        schedules = status.get("schedules", [])
-        for schedule in schedules:
-            if schedule.get("type") == "therm" and schedule.get("selected"):
-                attrs["active_schedule"] = schedule.get("name")
-                break
+        schedule = status.get("active_schedule")
+        if schedule:
+            attrs["active_schedule"] = schedule.get("name")
         
         return attrs
 
@@ -293,15 +301,7 @@ class MullerIntuisRoomClimate(CoordinatorEntity, ClimateEntity):
         room = self._get_room_data()
         if not room:
             return HVACMode.AUTO
-        
-        setpoint_mode = room.get("therm_setpoint_mode")
-        
-        if setpoint_mode == MODE_MANUAL:
-            return HVACMode.HEAT
-        elif setpoint_mode in [MODE_OFF, MODE_HG]:
-            return HVACMode.OFF
-        else:
-            return HVACMode.AUTO
+        return _room_hvac_mode(room.get("therm_setpoint_mode"))
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -312,17 +312,15 @@ class MullerIntuisRoomClimate(CoordinatorEntity, ClimateEntity):
         _LOGGER.info("Setting temperature to %s°C for %s", temperature, self._room_name)
         
         try:
-            await self.api_client.set_room_state(
-                self._home_id,
+            await self.coordinator.async_set_room_state(
                 self._room_id,
                 MODE_MANUAL,
                 temperature,
-                DEFAULT_MANUAL_DURATION
+                self.coordinator.manual_duration
             )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+        except IntuisError as err:
             _LOGGER.error("Error setting temperature: %s", err)
-            raise
+            raise HomeAssistantError(f"Error setting temperature: {err}") from err
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -330,20 +328,18 @@ class MullerIntuisRoomClimate(CoordinatorEntity, ClimateEntity):
         
         try:
             if hvac_mode == HVACMode.AUTO:
-                await self.api_client.set_room_state(self._home_id, self._room_id, MODE_HOME)
+                await self.coordinator.async_set_room_state(self._room_id, MODE_HOME)
             elif hvac_mode == HVACMode.HEAT:
                 room = self._get_room_data()
                 temp = room.get("therm_setpoint_temperature", 19) if room else 19
-                await self.api_client.set_room_state(
-                    self._home_id, self._room_id, MODE_MANUAL, temp, DEFAULT_MANUAL_DURATION
+                await self.coordinator.async_set_room_state(
+                    self._room_id, MODE_MANUAL, temp, self.coordinator.manual_duration
                 )
             elif hvac_mode == HVACMode.OFF:
-                await self.api_client.set_room_state(self._home_id, self._room_id, MODE_OFF)
-            
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+                await self.coordinator.async_set_room_state(self._room_id, MODE_OFF)
+        except IntuisError as err:
             _LOGGER.error("Error setting HVAC mode: %s", err)
-            raise
+            raise HomeAssistantError(f"Error setting HVAC mode: {err}") from err
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -357,19 +353,137 @@ class MullerIntuisRoomClimate(CoordinatorEntity, ClimateEntity):
             "setpoint_mode": room.get("therm_setpoint_mode"),
         }
         
-        if room.get("therm_setpoint_end_time"):
-            attrs["manual_mode_end_time"] = room["therm_setpoint_end_time"]
-        
-        if "heating_power_request" in room:
-            attrs["heating_power_request"] = room["heating_power_request"]
-        
-        if "reachable" in room:
-            attrs["reachable"] = room["reachable"]
-        
-        if "open_window" in room:
-            attrs["open_window"] = room["open_window"]
-        
-        if "anticipating" in room:
-            attrs["anticipating"] = room["anticipating"]
-        
+        # Volatile fields (end time, heating power, reachable, open window,
+        # anticipating) are exposed as sensors and binary sensors: any change
+        # here would record a full new state row for the climate entity.
         return attrs
+
+
+class MullerIntuisRoomGroupClimate(CoordinatorEntity, ClimateEntity):
+    """Climate entity for a configured group of rooms (a floor, a wing).
+
+    Reads aggregate the member rooms of the coordinator data once per
+    refresh; writes change every member in a single setstate call.
+    """
+
+    _attr_has_entity_name = False
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_hvac_modes = [HVACMode.AUTO, HVACMode.HEAT, HVACMode.OFF]
+    _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
+    _attr_min_temp = 7
+    _attr_max_temp = 30
+    _attr_target_temperature_step = 0.5
+
+    def __init__(self, coordinator, group: dict[str, Any], room_ids: list[str]) -> None:
+        """Initialize the room group climate entity."""
+        super().__init__(coordinator)
+        self._group_id = group["id"]
+        self._room_ids = room_ids
+        self._members = frozenset(room_ids)
+        self._home_id = coordinator.home_id
+        self._attr_unique_id = f"{self._home_id}_group_{self._group_id}_climate"
+        self._attr_name = group["name"]
+        self._update_from_rooms()
+
+    @property
+    def device_info(self):
+        """Return device info - same as home climate."""
+        return {
+            "identifiers": {(DOMAIN, f"{self._home_id}_home")},
+            "name": "Système de chauffage",
+            "manufacturer": "Muller Intuitiv",
+            "model": "Contrôle central",
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Aggregate the member rooms, then write the state."""
+        self._update_from_rooms()
+        super()._handle_coordinator_update()
+
+    def _update_from_rooms(self) -> None:
+        """Compute the group figures from the member rooms."""
+        rooms = [
+            room
+            for room in self.coordinator.data.get("status", {}).get("rooms", [])
+            if room.get("id") in self._members
+        ]
+        temperatures = [
+            room["therm_measured_temperature"]
+            for room in rooms
+            if room.get("therm_measured_temperature") is not None
+        ]
+        setpoints = [
+            room["therm_setpoint_temperature"]
+            for room in rooms
+            if room.get("therm_setpoint_temperature") is not None
+        ]
+        modes = {_room_hvac_mode(room.get("therm_setpoint_mode")) for room in rooms}
+
+        self._attr_current_temperature = (
+            round(sum(temperatures) / len(temperatures), 1) if temperatures else None
+        )
+        self._attr_target_temperature = (
+            round(sum(setpoints) / len(setpoints), 1) if setpoints else None
+        )
+        # Mixed modes read as AUTO: the group follows no single override
+        self._attr_hvac_mode = modes.pop() if len(modes) == 1 else HVACMode.AUTO
+        self._reachable = any(room.get("reachable", True) for room in rooms)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.last_update_success and self._reachable
+
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Set the target temperature of every member room."""
+        temperature = kwargs.get(ATTR_TEMPERATURE)
+        if temperature is None:
+            return
+
+        _LOGGER.info("Setting temperature to %s°C for group %s", temperature, self.name)
+
+        try:
+            await self.coordinator.async_set_rooms_state(
+                self._group_id,
+                self._room_ids,
+                MODE_MANUAL,
+                temperature,
+                self.coordinator.manual_duration,
+            )
+        except IntuisError as err:
+            _LOGGER.error("Error setting group temperature: %s", err)
+            raise HomeAssistantError(f"Error setting group temperature: {err}") from err
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Set the hvac mode of every member room."""
+        _LOGGER.info("Setting HVAC mode to %s for group %s", hvac_mode, self.name)
+
+        try:
+            if hvac_mode == HVACMode.AUTO:
+                await self.coordinator.async_set_rooms_state(
+                    self._group_id, self._room_ids, MODE_HOME
+                )
+            elif hvac_mode == HVACMode.HEAT:
+                # Every member gets the group target, on the setpoint grid
+                target = self.target_temperature
+                temp = round(target * 2) / 2 if target is not None else 19
+                await self.coordinator.async_set_rooms_state(
+                    self._group_id,
+                    self._room_ids,
+                    MODE_MANUAL,
+                    temp,
+                    self.coordinator.manual_duration,
+                )
+            elif hvac_mode == HVACMode.OFF:
+                await self.coordinator.async_set_rooms_state(
+                    self._group_id, self._room_ids, MODE_OFF
+                )
+        except IntuisError as err:
+            _LOGGER.error("Error setting group HVAC mode: %s", err)
+            raise HomeAssistantError(f"Error setting group HVAC mode: {err}") from err
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        return {"group_id": self._group_id, "room_ids": self._room_ids}
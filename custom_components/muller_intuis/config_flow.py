@@ -2,17 +2,58 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Mapping
 from typing import Any
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import (
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_NAME,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+)
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import slugify
 
-from .const import DOMAIN
+from .const import (
+    COMMAND_TIMEOUT_SECONDS,
+    CONF_COMMAND_TIMEOUT,
+    CONF_FILTER_DEVICE_TYPES,
+    CONF_HOME_ID,
+    CONF_MANUAL_DURATION,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RECORD_TRAFFIC,
+    CONF_REFRESH_TIMEOUT,
+    CONF_REQUEST_TIMEOUT,
+    CONF_RETRY_ATTEMPTS,
+    CONF_RETRY_BACKOFF,
+    CONF_ROOM_GROUPS,
+    CONF_ROOMS,
+    CONF_SCAN_INTERVAL,
+    CONF_TOKEN_REFRESH_MARGIN,
+    DEFAULT_MANUAL_DURATION,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_MANUAL_DURATION,
+    MIN_SCAN_INTERVAL_SECONDS,
+    REFRESH_TIMEOUT_SECONDS,
+    REQUEST_TIMEOUT_SECONDS,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF_SECONDS,
+    SCAN_INTERVAL_MAX_SECONDS,
+    SCAN_INTERVAL_MIN_SECONDS,
+    SCAN_INTERVAL_SECONDS,
+    TOKEN_REFRESH_MARGIN_SECONDS,
+)
+from .lib.intuis_core import IntuisAuthError, IntuisError, MullerIntuisApiClient
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,44 +69,69 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 
 async def validate_auth(
     hass, client_id: str, client_secret: str, username: str, password: str
-) -> dict[str, Any]:
-    """Validate the user input."""
-    session = async_get_clientsession(hass)
-
-    auth_data = {
-        "client_id": client_id,
-        "client_secret": client_secret,
-        "username": username,
-        "password": password,
-        "grant_type": "password",
-        "user_prefix": "muller",
-        "scope": "read_muller write_muller",
+) -> MullerIntuisApiClient:
+    """Log in with the user input; return the authenticated client."""
+    client = MullerIntuisApiClient(
+        async_get_clientsession(hass), client_id, client_secret, username, password
+    )
+    try:
+        await client.async_authenticate()
+    except IntuisAuthError as err:
+        # Credentials rejected (AUTH_REJECTED_STATUSES) or no token returned
+        raise InvalidAuth from err
+    except IntuisError as err:
+        # Throttling, an outage or the network: the password may well be right
+        raise CannotConnect from err
+    return client
+
+
+def token_data(client: MullerIntuisApiClient) -> dict[str, Any]:
+    """Return the entry data fields holding the tokens of a logged in client."""
+    tokens = client.tokens
+    return {
+        "access_token": tokens["access_token"],
+        "refresh_token_value": tokens["refresh_token"],
+        "expires_in": max(0, int(tokens["expires_at"] - time.time())),
     }
 
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
+async def fetch_homes(client: MullerIntuisApiClient) -> list[dict[str, Any]]:
+    """Fetch the homes (with their rooms) of the account."""
     try:
-        async with session.post(
-            "https://app.muller-intuitiv.net/oauth2/token",
-            data=auth_data,
-            headers=headers,
-            timeout=aiohttp.ClientTimeout(total=30),
-        ) as response:
-            if response.status != 200:
-                raise InvalidAuth
-
-            data = await response.json()
-            if "access_token" not in data:
-                raise InvalidAuth
-
-            return {
-                "access_token": data["access_token"],
-                "refresh_token": data["refresh_token"],
-                "expires_in": data.get("expires_in", 10800),
-            }
+        response = await client.get_homes_data()
+    except IntuisError as err:
+        raise CannotConnect from err
+    return response.get("body", {}).get("homes", [])
+
+
+def account_id(username: str) -> str:
+    """Return the account of ``username``; its homes share tokens and a client."""
+    return username.lower()
+
+
+def home_unique_id(username: str, home_id: str) -> str:
+    """Return the unique id of the entry managing ``home_id`` of an account."""
+    return f"{account_id(username)}_{home_id}"
+
+
+def rooms_schema(rooms: list[dict[str, Any]], selected: list[str] | None) -> vol.Schema:
+    """Build the room selection schema; everything is selected by default."""
+    choices = {room["id"]: room.get("name", room["id"]) for room in rooms if "id" in room}
+    default = [room_id for room_id in (selected or choices) if room_id in choices]
+    return vol.Schema(
+        {vol.Required(CONF_ROOMS, default=default): cv.multi_select(choices)}
+    )
 
-    except aiohttp.ClientError:
-        raise CannotConnect
+
+def rooms_option(rooms: list[dict[str, Any]], selected: list[str]) -> list[str] | None:
+    """Return the rooms option, or None when every room is selected.
+
+    Leaving the option unset keeps rooms added to the account later in scope.
+    """
+    all_ids = {room["id"] for room in rooms if "id" in room}
+    if all_ids <= set(selected):
+        return None
+    return list(selected)
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -73,13 +139,27 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._data: dict[str, Any] = {}
+        self._homes: list[dict[str, Any]] = []
+        self._home: dict[str, Any] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the initial step."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
             try:
-                auth_info = await validate_auth(
+                client = await validate_auth(
                     self.hass,
                     user_input[CONF_CLIENT_ID],
                     user_input[CONF_CLIENT_SECRET],
@@ -87,21 +167,26 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     user_input[CONF_PASSWORD],
                 )
 
-                await self.async_set_unique_id(user_input[CONF_USERNAME].lower())
-                self._abort_if_unique_id_configured()
+                homes = await fetch_homes(client)
+                if not homes:
+                    return self.async_abort(reason="no_homes")
+                configured = self._configured_home_ids(user_input[CONF_USERNAME], homes)
+                self._homes = [home for home in homes if home["id"] not in configured]
+                if not self._homes:
+                    return self.async_abort(reason="already_configured")
 
-                return self.async_create_entry(
-                    title=f"Muller Intuis ({user_input[CONF_USERNAME]})",
-                    data={
-                        CONF_CLIENT_ID: user_input[CONF_CLIENT_ID],
-                        CONF_CLIENT_SECRET: user_input[CONF_CLIENT_SECRET],
-                        CONF_USERNAME: user_input[CONF_USERNAME],
-                        CONF_PASSWORD: user_input[CONF_PASSWORD],
-                        "access_token": auth_info["access_token"],
-                        "refresh_token_value": auth_info["refresh_token"],
-                        "expires_in": auth_info["expires_in"],
-                    },
-                )
+                self._data = {
+                    CONF_CLIENT_ID: user_input[CONF_CLIENT_ID],
+                    CONF_CLIENT_SECRET: user_input[CONF_CLIENT_SECRET],
+                    CONF_USERNAME: user_input[CONF_USERNAME],
+                    CONF_PASSWORD: user_input[CONF_PASSWORD],
+                    **token_data(client),
+                }
+
+                if len(self._homes) > 1:
+                    return await self.async_step_home()
+
+                return await self._async_select_home(self._homes[0])
 
             except CannotConnect:
                 errors["base"] = "cannot_connect"
@@ -117,6 +202,285 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_home(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Choose the home managed by this entry."""
+        if user_input is not None:
+            return await self._async_select_home(
+                next(home for home in self._homes if home["id"] == user_input[CONF_HOME_ID])
+            )
+
+        choices = {home["id"]: home.get("name", home["id"]) for home in self._homes}
+        return self.async_show_form(
+            step_id="home",
+            data_schema=vol.Schema({vol.Required(CONF_HOME_ID): vol.In(choices)}),
+        )
+
+    def _configured_home_ids(self, username: str, homes: list[dict[str, Any]]) -> set[str]:
+        """Return the ids of the homes of ``username`` already managed by an entry.
+
+        Entries created before the per-home unique id use the account alone
+        and manage their configured home, or the first one.
+        """
+        configured = set()
+        for entry in self._async_current_entries(include_ignore=False):
+            if account_id(entry.data.get(CONF_USERNAME, "")) != account_id(username):
+                continue
+            if (home_id := entry.data.get(CONF_HOME_ID)) is None and homes:
+                home_id = homes[0]["id"]
+            configured.add(home_id)
+        return configured
+
+    async def _async_select_home(self, home: dict[str, Any]) -> FlowResult:
+        """Set the unique id of the chosen home, then choose its rooms."""
+        self._home = home
+        await self.async_set_unique_id(home_unique_id(self._data[CONF_USERNAME], home["id"]))
+        self._abort_if_unique_id_configured()
+        return await self.async_step_rooms()
+
+    async def async_step_rooms(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Choose the rooms polled and exposed."""
+        errors: dict[str, str] = {}
+        rooms = self._home.get("rooms", [])
+
+        if user_input is not None:
+            if user_input[CONF_ROOMS]:
+                options = {}
+                selected = rooms_option(rooms, user_input[CONF_ROOMS])
+                if selected is not None:
+                    options[CONF_ROOMS] = selected
+
+                home_name = self._home.get("name", self._home["id"])
+                return self.async_create_entry(
+                    title=f"Muller Intuis ({self._data[CONF_USERNAME]} - {home_name})",
+                    data={**self._data, CONF_HOME_ID: self._home["id"]},
+                    options=options,
+                )
+            errors["base"] = "no_rooms"
+
+        return self.async_show_form(
+            step_id="rooms",
+            data_schema=rooms_schema(rooms, None),
+            errors=errors,
+        )
+
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
+        """Start reauthentication once logging in with the stored password fails."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask for the new password of the account."""
+        errors: dict[str, str] = {}
+        entry = self._get_reauth_entry()
+
+        if user_input is not None:
+            try:
+                client = await validate_auth(
+                    self.hass,
+                    entry.data[CONF_CLIENT_ID],
+                    entry.data[CONF_CLIENT_SECRET],
+                    entry.data[CONF_USERNAME],
+                    user_input[CONF_PASSWORD],
+                )
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            except InvalidAuth:
+                errors["base"] = "invalid_auth"
+            except Exception:
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                # The other homes of the account share its password
+                for other in self.hass.config_entries.async_entries(DOMAIN):
+                    if other.entry_id != entry.entry_id and account_id(
+                        other.data[CONF_USERNAME]
+                    ) == account_id(entry.data[CONF_USERNAME]):
+                        self.hass.config_entries.async_update_entry(
+                            other, data={**other.data, CONF_PASSWORD: user_input[CONF_PASSWORD]}
+                        )
+                return self.async_update_reload_and_abort(
+                    entry,
+                    data_updates={
+                        CONF_PASSWORD: user_input[CONF_PASSWORD],
+                        **token_data(client),
+                    },
+                )
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema({vol.Required(CONF_PASSWORD): str}),
+            description_placeholders={CONF_USERNAME: entry.data[CONF_USERNAME]},
+            errors=errors,
+        )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle runtime tuning options, the room scope and the room groups.
+
+    Tuning options are applied without reloading the entry; a scope or group
+    change reloads it so the entity set follows.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the options flow."""
+        self._options: dict[str, Any] = {}
+        self._rooms: list[dict[str, Any]] | None = None
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Manage the polling, timeout, concurrency and retry options."""
+        if user_input is not None:
+            self._options = {**self.config_entry.options, **user_input}
+            if await self._async_home_rooms():
+                return await self.async_step_rooms()
+            return self.async_create_entry(title="", data=self._options)
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_SCAN_INTERVAL,
+                    default=options.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL_SECONDS),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=SCAN_INTERVAL_MIN_SECONDS, max=SCAN_INTERVAL_MAX_SECONDS),
+                ),
+                vol.Required(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=options.get(CONF_MIN_SCAN_INTERVAL, MIN_SCAN_INTERVAL_SECONDS),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=SCAN_INTERVAL_MIN_SECONDS, max=SCAN_INTERVAL_MAX_SECONDS),
+                ),
+                vol.Required(
+                    CONF_REFRESH_TIMEOUT,
+                    default=options.get(CONF_REFRESH_TIMEOUT, REFRESH_TIMEOUT_SECONDS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
+                vol.Required(
+                    CONF_REQUEST_TIMEOUT,
+                    default=options.get(CONF_REQUEST_TIMEOUT, REQUEST_TIMEOUT_SECONDS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+                vol.Required(
+                    CONF_COMMAND_TIMEOUT,
+                    default=options.get(CONF_COMMAND_TIMEOUT, COMMAND_TIMEOUT_SECONDS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+                vol.Required(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=options.get(CONF_MAX_CONCURRENT_REQUESTS, MAX_CONCURRENT_REQUESTS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                vol.Required(
+                    CONF_RETRY_ATTEMPTS,
+                    default=options.get(CONF_RETRY_ATTEMPTS, RETRY_ATTEMPTS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
+                vol.Required(
+                    CONF_RETRY_BACKOFF,
+                    default=options.get(CONF_RETRY_BACKOFF, RETRY_BACKOFF_SECONDS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                vol.Required(
+                    CONF_TOKEN_REFRESH_MARGIN,
+                    default=options.get(CONF_TOKEN_REFRESH_MARGIN, TOKEN_REFRESH_MARGIN_SECONDS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Required(
+                    CONF_MANUAL_DURATION,
+                    default=options.get(CONF_MANUAL_DURATION, DEFAULT_MANUAL_DURATION),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=MAX_MANUAL_DURATION)),
+                vol.Required(
+                    CONF_FILTER_DEVICE_TYPES,
+                    default=options.get(CONF_FILTER_DEVICE_TYPES, False),
+                ): bool,
+                vol.Required(
+                    CONF_RECORD_TRAFFIC,
+                    default=options.get(CONF_RECORD_TRAFFIC, False),
+                ): bool,
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=schema)
+
+    async def async_step_rooms(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Manage the rooms polled and exposed."""
+        errors: dict[str, str] = {}
+        rooms = await self._async_home_rooms()
+
+        if user_input is not None:
+            if user_input[CONF_ROOMS]:
+                self._options.pop(CONF_ROOMS, None)
+                selected = rooms_option(rooms, user_input[CONF_ROOMS])
+                if selected is not None:
+                    self._options[CONF_ROOMS] = selected
+                return await self.async_step_groups()
+            errors["base"] = "no_rooms"
+
+        return self.async_show_form(
+            step_id="rooms",
+            data_schema=rooms_schema(rooms, self.config_entry.options.get(CONF_ROOMS)),
+            errors=errors,
+        )
+
+    async def async_step_groups(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Keep or drop the room groups and add one; loops while groups are added."""
+        errors: dict[str, str] = {}
+        groups: list[dict[str, Any]] = self._options.get(CONF_ROOM_GROUPS, [])
+        in_scope = self._options.get(CONF_ROOMS)
+        choices = {
+            room["id"]: room.get("name", room["id"])
+            for room in await self._async_home_rooms()
+            if "id" in room and (in_scope is None or room["id"] in in_scope)
+        }
+
+        if user_input is not None:
+            kept = [group for group in groups if group["id"] in user_input[CONF_ROOM_GROUPS]]
+            name = user_input.get(CONF_NAME, "").strip()
+            group_rooms = user_input.get(CONF_ROOMS, [])
+            if not name:
+                self._options[CONF_ROOM_GROUPS] = kept
+                return self.async_create_entry(title="", data=self._options)
+            group_id = slugify(name)
+            if not group_rooms:
+                errors["base"] = "no_rooms"
+            elif any(group["id"] == group_id for group in kept):
+                errors[CONF_NAME] = "group_exists"
+            else:
+                self._options[CONF_ROOM_GROUPS] = [
+                    *kept,
+                    {"id": group_id, "name": name, CONF_ROOMS: list(group_rooms)},
+                ]
+                return await self.async_step_groups()
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_ROOM_GROUPS, default=[group["id"] for group in groups]
+                ): cv.multi_select({group["id"]: group["name"] for group in groups}),
+                vol.Optional(CONF_NAME): str,
+                vol.Optional(CONF_ROOMS, default=[]): cv.multi_select(choices),
+            }
+        )
+        return self.async_show_form(step_id="groups", data_schema=schema, errors=errors)
+
+    async def _async_home_rooms(self) -> list[dict[str, Any]]:
+        """Return every room of the home, fetched once per flow.
+
+        Fetched rather than taken from the coordinator, which reads homesdata
+        at setup only, so rooms added in the app since then are offered.
+        """
+        if self._rooms is not None:
+            return self._rooms
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if not entry_data:
+            return []
+        coordinator = entry_data["coordinator"]
+        self._rooms = coordinator.homes_data.get("rooms", [])
+        try:
+            response = await entry_data["api_client"].get_homes_data()
+        except IntuisError as err:
+            _LOGGER.warning("Could not fetch the rooms, using the cached ones: %s", err)
+            return self._rooms
+        for home in response.get("body", {}).get("homes", []):
+            if home.get("id") == coordinator.home_id:
+                self._rooms = home.get("rooms", [])
+        return self._rooms
+
 
 class CannotConnect(Exception):
     """Error to indicate we cannot connect."""
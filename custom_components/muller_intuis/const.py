@@ -1,38 +1,72 @@
 """Constants for the Muller Intuis Connect integration."""
+# API endpoints, OAuth2 parameters and HTTP client tuning live in the core
+# library; they are re-exported here for the integration modules.
+from .lib.intuis_core.const import (  # noqa: F401
+    API_AUTH_URL,
+    API_BASE_URL,
+    API_HOMESDATA_URL,
+    API_HOMESTATUS_URL,
+    API_SETSTATE_URL,
+    API_SETTHERMMODE_URL,
+    API_SWITCHHOMESCHEDULE_URL,
+    COMMAND_TIMEOUT_SECONDS,
+    GLOBAL_MAX_CONCURRENT_REQUESTS,
+    MAX_CONCURRENT_REQUESTS,
+    MODE_AWAY,
+    MODE_HG,
+    MODE_HOME,
+    MODE_HOME_HG,
+    MODE_MANUAL,
+    MODE_OFF,
+    MODE_SCHEDULE,
+    OAUTH_GRANT_TYPE,
+    OAUTH_SCOPE,
+    OAUTH_USER_PREFIX,
+    REQUEST_TIMEOUT_SECONDS,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF_SECONDS,
+    TOKEN_REFRESH_MARGIN_SECONDS,
+    TRANSITIONS,
+)
 
 DOMAIN = "muller_intuis"
 
 # Configuration keys
 CONF_HOME_ID = "home_id"
-
-# API endpoints
-API_BASE_URL = "https://app.muller-intuitiv.net"
-API_AUTH_URL = f"{API_BASE_URL}/oauth2/token"
-API_HOMESDATA_URL = f"{API_BASE_URL}/api/homesdata"
-API_HOMESTATUS_URL = f"{API_BASE_URL}/api/homestatus"
-API_SETSTATE_URL = f"{API_BASE_URL}/syncapi/v1/setstate"
-API_SETTHERMMODE_URL = f"{API_BASE_URL}/api/setthermmode"
-API_SWITCHHOMESCHEDULE_URL = f"{API_BASE_URL}/api/switchhomeschedule"
-
-# OAuth2 parameters
-OAUTH_USER_PREFIX = "muller"
-OAUTH_SCOPE = "read_muller write_muller"
-OAUTH_GRANT_TYPE = "password"
+CONF_ROOMS = "rooms"  # Rooms polled and exposed; absent means all rooms
+CONF_ROOM_GROUPS = "room_groups"  # [{"id", "name", "rooms"}], one climate entity each
 
 # Update intervals
 SCAN_INTERVAL_SECONDS = 300  # 5 minutes
-TOKEN_REFRESH_MARGIN_SECONDS = 300  # 5 minutes before expiry
+SCAN_INTERVAL_MIN_SECONDS = 30  # Bounds accepted by the options flow
+SCAN_INTERVAL_MAX_SECONDS = 3600
+MIN_SCAN_INTERVAL_SECONDS = 60  # Floor when polling ahead of a schedule change
+TRANSITION_GRACE_SECONDS = 30  # Delay after an expected change before polling
+REFRESH_TIMEOUT_SECONDS = 45  # Whole coordinator refresh, retries included
+HOMES_DATA_REFRESH_SECONDS = 3600  # Re-read rooms and schedules, changed in the app
 
-# Modes for rooms (individual heaters)
-MODE_MANUAL = "manual"
-MODE_HOME = "home"  # Follow house schedule
-MODE_OFF = "off"    # Turn off this room
-MODE_HG = "hg"      # Frost protection for this room
+# Options (config entry options flow)
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_TOKEN_REFRESH_MARGIN = "token_refresh_margin"
+CONF_REQUEST_TIMEOUT = "request_timeout"
+CONF_REFRESH_TIMEOUT = "refresh_timeout"
+CONF_COMMAND_TIMEOUT = "command_timeout"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_RETRY_ATTEMPTS = "retry_attempts"
+CONF_RETRY_BACKOFF = "retry_backoff"
+CONF_MANUAL_DURATION = "manual_duration"
+CONF_RECORD_TRAFFIC = "record_traffic"
+CONF_FILTER_DEVICE_TYPES = "filter_device_types"  # Ask homestatus for our module types only
 
-# Modes for home (entire house)
-MODE_SCHEDULE = "schedule"  # Follow active schedule
-MODE_AWAY = "away"         # Away mode
-MODE_HOME_HG = "hg"        # Frost protection for entire home
+# Per-account token storage (.storage/muller_intuis.<account hash>.tokens),
+# shared by the entries (homes) of the account
+TOKEN_STORAGE_VERSION = 1
+TOKEN_STORAGE_KEY = "muller_intuis.{account}.tokens"
+LEGACY_TOKEN_STORAGE_KEY = "muller_intuis.{entry_id}.tokens"  # Before sharing, per entry
+
+# API traffic recording (written to the config directory)
+TRAFFIC_RECORDING_FILENAME = "muller_intuis_traffic_{entry_id}.jsonl"
 
 # HVAC modes mapping
 HVAC_MODE_MAP = {
@@ -48,6 +82,20 @@ PRESET_AWAY = "away"
 PRESET_FROST_PROTECTION = "frost_protection"
 PRESET_MANUAL = "manual"
 
+# Services
+SERVICE_PROFILE = "profile"
+SERVICE_ANALYZE_SCHEDULE = "analyze_schedule"
+
+# Prometheus scrape endpoint (Home Assistant authentication applies)
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+
+# Events fired on room transitions: muller_intuis_<transition>, e.g.
+# muller_intuis_window_opened (see TRANSITIONS)
+EVENT_PREFIX = DOMAIN
+
+# Profiling output (written to the config directory, without extension)
+PROFILE_FILENAME = "muller_intuis_profile_{timestamp}"
+
 # Attributes
 ATTR_ROOM_ID = "room_id"
 ATTR_SCHEDULE_ID = "schedule_id"
@@ -55,6 +103,11 @@ ATTR_MODE = "mode"
 ATTR_TEMP = "temp"
 ATTR_DURATION = "duration"
 ATTR_END_TIME = "endtime"
+ATTR_REFRESHES = "refreshes"
+ATTR_HOME_ID = "home_id"
+ATTR_COMPARE_SCHEDULE_ID = "compare_schedule_id"
+ATTR_TIMETABLE = "timetable"
+ATTR_ZONES = "zones"
 
 # Default duration for manual mode (in minutes)
 DEFAULT_MANUAL_DURATION = 180  # 3 hours
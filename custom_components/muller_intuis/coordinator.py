@@ -0,0 +1,375 @@
+"""Data update coordinator for Muller Intuis Connect."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Hashable, Iterable, Mapping
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_FILTER_DEVICE_TYPES,
+    CONF_MANUAL_DURATION,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_REFRESH_TIMEOUT,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_MANUAL_DURATION,
+    DOMAIN,
+    EVENT_PREFIX,
+    HOMES_DATA_REFRESH_SECONDS,
+    MIN_SCAN_INTERVAL_SECONDS,
+    REFRESH_TIMEOUT_SECONDS,
+    SCAN_INTERVAL_SECONDS,
+    TRANSITION_GRACE_SECONDS,
+)
+from .lib.intuis_core import (
+    IntuisAuthError,
+    IntuisError,
+    MullerIntuisApiClient,
+    build_room_state,
+)
+from .lib.intuis_core.aggregates import HomeAggregates
+from .lib.intuis_core.diff import diff_rooms
+from .lib.intuis_core.models import module_types
+from .lib.intuis_core.pipeline import CommandPipeline
+from .lib.intuis_core.schedule import active_schedule, next_expected_change, therm_schedules
+from .profiler import RefreshProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+GROUP_COMMAND_KEY = "group"  # Pipeline keys of room groups are (GROUP_COMMAND_KEY, group id)
+HOME_COMMAND_KEY = "home"  # Pipeline key of home-wide writes is (HOME_COMMAND_KEY, home id)
+
+
+class MullerIntuisDataUpdateCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching Muller Intuis data."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_client: MullerIntuisApiClient,
+        home_id: str | None = None,
+        room_ids: Iterable[str] | None = None,
+        profiler: RefreshProfiler | None = None,
+    ) -> None:
+        """Initialize.
+
+        ``home_id`` selects the home to poll (first home of the account when
+        unset) and ``room_ids`` restricts the rooms kept in the snapshot
+        (all rooms when unset).
+        """
+        self.api_client = api_client
+        self.home_id: str | None = None
+        self.home_name: str | None = None
+        self.homes_data: dict[str, Any] = {}
+        self._homes_data_loaded_at = 0.0  # time.monotonic() of the last homesdata
+        self.room_ids: set[str] | None = set(room_ids) if room_ids is not None else None
+        self._configured_home_id = home_id
+        self._rooms_info: list[dict[str, Any]] = []
+        self.profiler = profiler or RefreshProfiler(hass)
+        self.manual_duration = DEFAULT_MANUAL_DURATION
+        self.scan_interval = SCAN_INTERVAL_SECONDS
+        self.min_scan_interval = MIN_SCAN_INTERVAL_SECONDS
+        self._time_zone = dt_util.get_default_time_zone()
+        self.refresh_timeout = REFRESH_TIMEOUT_SECONDS
+        self.filter_device_types = False
+        self._device_types: list[str] | None = None
+        self._fetch_task: asyncio.Task | None = None
+        # Bumped on every successful refresh, for caches derived from data
+        self.generation = 0
+        self._previous_rooms: dict[str, dict[str, Any]] = {}
+        self.aggregates = HomeAggregates()
+        # Keyed by room id, by group for room group writes, by home for home-wide ones
+        self.commands: CommandPipeline[list[dict[str, Any]]] = CommandPipeline(
+            self._async_send_rooms_state, slot=api_client.request_slot
+        )
+        self._pending_transitions: list[tuple[str, dict[str, Any]]] = []
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=SCAN_INTERVAL_SECONDS),
+        )
+
+    def apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply polling options; the new interval is used from the next poll."""
+        self.scan_interval = options.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL_SECONDS)
+        self.min_scan_interval = min(
+            options.get(CONF_MIN_SCAN_INTERVAL, MIN_SCAN_INTERVAL_SECONDS), self.scan_interval
+        )
+        self.update_interval = timedelta(seconds=self.scan_interval)
+        self.manual_duration = options.get(CONF_MANUAL_DURATION, DEFAULT_MANUAL_DURATION)
+        self.refresh_timeout = options.get(CONF_REFRESH_TIMEOUT, REFRESH_TIMEOUT_SECONDS)
+        self.filter_device_types = options.get(CONF_FILTER_DEVICE_TYPES, False)
+
+    def _plan_next_poll(self, status: dict[str, Any]) -> None:
+        """Poll just after the next expected setpoint change.
+
+        The interval stays within ``min_scan_interval`` and ``scan_interval``;
+        the coordinator schedules the next poll with it once this refresh ends.
+        """
+        now = dt_util.now(self._time_zone)
+        interval = self.scan_interval
+        change = next_expected_change(status, status.get("active_schedule"), now)
+        if change is not None:
+            until_change = change - now.timestamp() + TRANSITION_GRACE_SECONDS
+            interval = max(self.min_scan_interval, min(interval, until_change))
+        self.update_interval = timedelta(seconds=interval)
+
+    def _filter_rooms(self, rooms: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Keep only the rooms within the configured scope."""
+        if self.room_ids is None:
+            return rooms
+        return [room for room in rooms if room.get("id") in self.room_ids]
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Update data, under the profiler when a profile was requested.
+
+        A profiled refresh is counted when it ends, whether it succeeded,
+        failed, timed out or was superseded.
+        """
+        if not self.profiler.active:
+            return await self._async_latest_fetch()
+        with self.profiler.profile():
+            try:
+                return await self._async_latest_fetch()
+            finally:
+                self.profiler.refresh_done()
+
+    async def _async_latest_fetch(self) -> dict[str, Any]:
+        """Fetch data, superseding any fetch still in flight.
+
+        A refresh started while another is running (a user command followed
+        by a poll, for instance) cancels the older fetch; the older caller
+        then returns the newer fetch's result instead of stale data.
+        """
+        if self._fetch_task is not None and not self._fetch_task.done():
+            _LOGGER.debug("Cancelling superseded refresh")
+            self._fetch_task.cancel()
+        task = self._fetch_task = asyncio.create_task(self._async_timed_fetch())
+
+        while True:
+            try:
+                return await task
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                if (current is not None and current.cancelling()) or task is self._fetch_task:
+                    # This refresh itself is being cancelled (unload, shutdown)
+                    raise
+                task = self._fetch_task
+
+    async def _async_timed_fetch(self) -> dict[str, Any]:
+        """Fetch data within the refresh deadline."""
+        try:
+            async with asyncio.timeout(self.refresh_timeout):
+                return await self._async_fetch_data()
+        except TimeoutError as err:
+            raise UpdateFailed(
+                f"Refresh did not complete within {self.refresh_timeout}s"
+            ) from err
+
+    async def async_shutdown(self) -> None:
+        """Cancel the fetch and commands in flight, then shut the coordinator down."""
+        if self._fetch_task is not None and not self._fetch_task.done():
+            self._fetch_task.cancel()
+        await self.commands.async_shutdown()
+        await super().async_shutdown()
+
+    async def async_set_room_state(
+        self, room_id: str, mode: str, temp: float | None = None, duration: int | None = None
+    ) -> None:
+        """Change the state of a room through the command pipeline, then refresh.
+
+        Rapid changes of the same room (a slider being dragged, a ramping
+        automation) collapse into the latest one; see ``CommandPipeline``.
+        """
+        await self.commands.submit(room_id, [build_room_state(room_id, mode, temp, duration)])
+        await self.async_request_refresh()
+
+    async def async_set_rooms_state(
+        self,
+        group: str,
+        room_ids: Iterable[str],
+        mode: str,
+        temp: float | None = None,
+        duration: int | None = None,
+    ) -> None:
+        """Change several rooms in one setstate call, then refresh.
+
+        The group write covers the commands still queued for these rooms,
+        and room commands submitted later go out after it. Changes of the
+        same ``group`` collapse like those of a room.
+        """
+        room_ids = list(room_ids)
+        await self.commands.submit(
+            (GROUP_COMMAND_KEY, group),
+            [build_room_state(room_id, mode, temp, duration) for room_id in room_ids],
+            covers=room_ids,
+        )
+        await self.async_request_refresh()
+
+    async def async_set_home_rooms_mode(self, mode: str, therm_mode: str | None = None) -> None:
+        """Set every room to ``mode``, after the home ``therm_mode`` if given, then refresh.
+
+        The room write goes through the command pipeline covering all rooms,
+        so room and group commands still queued are absorbed by it or go out
+        before it, and cannot undo it afterwards.
+        """
+        if therm_mode is not None:
+            await self.api_client.set_therm_mode(self.home_id, therm_mode)
+        room_ids = [
+            room["id"] for room in self.data.get("status", {}).get("rooms", []) if room.get("id")
+        ]
+        await self.commands.submit(
+            (HOME_COMMAND_KEY, self.home_id),
+            [build_room_state(room_id, mode) for room_id in room_ids],
+            covers=room_ids,
+        )
+        await self.async_request_refresh()
+
+    async def _async_send_rooms_state(
+        self, key: Hashable, rooms_state: list[dict[str, Any]]
+    ) -> None:
+        """Send the state of one room, group or home; called by the command pipeline."""
+        await self.api_client.set_rooms_state(self.home_id, rooms_state)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners, under the profiler while a profile is running.
+
+        Room transitions of the last refresh are fired afterwards so that
+        automations triggered by them see the updated entity states.
+        """
+        if not self.profiler.profiling:
+            super().async_update_listeners()
+        else:
+            with self.profiler.profile():
+                super().async_update_listeners()
+        self._fire_transitions()
+
+    def _track_transitions(self, rooms: list[dict[str, Any]]) -> None:
+        """Queue the room transitions since the previous snapshot."""
+        self._pending_transitions.extend(
+            diff_rooms(self._previous_rooms, rooms, time.time())
+        )
+        self._previous_rooms = {room.get("id"): room for room in rooms}
+
+    @callback
+    def _fire_transitions(self) -> None:
+        """Fire one muller_intuis_<transition> event per queued transition."""
+        if not self._pending_transitions:
+            return
+        pending, self._pending_transitions = self._pending_transitions, []
+        names = {room.get("id"): room.get("name") for room in self._rooms_info}
+        for transition, room in pending:
+            room_id = room.get("id")
+            _LOGGER.debug("Room %s: %s", room_id, transition)
+            self.hass.bus.async_fire(
+                f"{EVENT_PREFIX}_{transition}",
+                {
+                    "home_id": self.home_id,
+                    "room_id": room_id,
+                    "room_name": names.get(room_id),
+                    "therm_setpoint_mode": room.get("therm_setpoint_mode"),
+                    "therm_setpoint_temperature": room.get("therm_setpoint_temperature"),
+                },
+            )
+
+    async def _async_load_home(self) -> None:
+        """Fetch homesdata and keep the configured home, its rooms and schedules."""
+        homes_response = await self.api_client.get_homes_data()
+        homes = homes_response.get("body", {}).get("homes", [])
+
+        if not homes:
+            raise UpdateFailed("No homes found in account")
+
+        home_id = self.home_id or self._configured_home_id
+        home = homes[0]
+        if home_id:
+            home = next((h for h in homes if h.get("id") == home_id), None)
+            if home is None:
+                raise UpdateFailed(f"Home {home_id} not found in account")
+
+        first_load = not self.home_id
+        self.home_id = home["id"]
+        self.home_name = home.get("name", "Domicile")
+        self.homes_data = home
+        self._homes_data_loaded_at = time.monotonic()
+        self._rooms_info = self._filter_rooms(home.get("rooms", []))
+        self._device_types = module_types(home, self.room_ids)
+        # Timetable offsets are wall clock minutes of the home;
+        # get_time_zone raises on an empty name instead of returning None
+        time_zone = home.get("timezone")
+        self._time_zone = (
+            dt_util.get_time_zone(time_zone) if isinstance(time_zone, str) and time_zone else None
+        ) or dt_util.get_default_time_zone()
+        if first_load:
+            _LOGGER.info("Using home: %s (ID: %s) with %d/%d rooms",
+                         self.home_name, self.home_id, len(self._rooms_info),
+                         len(home.get("rooms", [])))
+
+    async def async_switch_schedule(self, schedule_id: str) -> None:
+        """Switch the active schedule, then refresh.
+
+        The new schedule is marked selected in the cached home data, which
+        is only re-read hourly, so polls are planned on its timetable.
+        """
+        await self.api_client.switch_home_schedule(self.home_id, schedule_id)
+        for schedule in therm_schedules(self.homes_data.get("schedules", [])):
+            schedule["selected"] = schedule.get("id") == schedule_id
+        await self.async_request_refresh()
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Update data via library."""
+        try:
+            if not self.home_id:
+                await self._async_load_home()
+            elif time.monotonic() - self._homes_data_loaded_at >= HOMES_DATA_REFRESH_SECONDS:
+                # Rooms and schedules edited in the app, or switched there
+                try:
+                    await self._async_load_home()
+                except IntuisAuthError:
+                    raise
+                except (IntuisError, UpdateFailed) as err:
+                    _LOGGER.warning("Keeping the previous home data: %s", err)
+
+            status_data = await self.api_client.get_home_status(
+                self.home_id,
+                device_types=self._device_types if self.filter_device_types else None,
+                trim=True,
+            )
+            status = status_data.get("body", {}).get("home", {})
+            status["rooms"] = self._filter_rooms(status.get("rooms", []))
+            self._track_transitions(status["rooms"])
+            self.aggregates.update(status["rooms"])
+            
+            status["rooms_info"] = self._rooms_info
+            status["schedules"] = self.homes_data.get("schedules", [])
+            # Resolved once per refresh rather than by each entity state write
+            status["active_schedule"] = active_schedule(status["schedules"])
+            self._plan_next_poll(status)
+            status["home_name"] = self.home_name
+            self.generation += 1
+            
+            return {
+                "home_id": self.home_id,
+                "home_name": self.home_name,
+                "status": status,
+                "homes_data": self.homes_data,
+            }
+
+        except IntuisAuthError as err:
+            raise ConfigEntryAuthFailed(str(err)) from err
+        except Exception as err:
+            _LOGGER.exception("Error communicating with API: %s", err)
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
@@ -0,0 +1 @@
+"""Libraries bundled with the integration, importable without Home Assistant."""
@@ -0,0 +1,37 @@
+"""Home Assistant independent core of the Muller Intuis Connect integration.
+
+Everything in this package depends only on asyncio and aiohttp, and imports
+its own modules relatively. Home Assistant loads it as
+``custom_components.muller_intuis.lib.intuis_core``; workers, scripts and
+tests can import it as ``intuis_core`` with the ``lib`` directory on
+``sys.path`` and so never load Home Assistant.
+"""
+from .client import MullerIntuisApiClient, build_room_state
+from .exceptions import (
+    IntuisApiError,
+    IntuisAuthError,
+    IntuisError,
+    IntuisTokenRejectedError,
+    IntuisTransientError,
+)
+from .metrics import HomeMetrics, RequestMetrics, render_prometheus
+from .recording import ReplaySession, TrafficRecorder
+from .storage import JsonFileTokenStore, MemoryTokenStore, TokenStore
+
+__all__ = [
+    "HomeMetrics",
+    "IntuisApiError",
+    "IntuisAuthError",
+    "IntuisError",
+    "IntuisTokenRejectedError",
+    "IntuisTransientError",
+    "JsonFileTokenStore",
+    "MemoryTokenStore",
+    "MullerIntuisApiClient",
+    "ReplaySession",
+    "RequestMetrics",
+    "TokenStore",
+    "TrafficRecorder",
+    "build_room_state",
+    "render_prometheus",
+]
@@ -0,0 +1,6 @@
+"""Run the command-line tool: ``python -m intuis_core``."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,113 @@
+"""Home-level figures maintained incrementally from room snapshots."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+
+class _Contribution(NamedTuple):
+    """What one room adds to the home aggregates."""
+
+    heating_power: int
+    temperature: float | None
+    open_window: bool
+    unreachable: bool
+
+
+def _contribution(room: dict[str, Any]) -> _Contribution:
+    """Return the contribution of a room status."""
+    return _Contribution(
+        room.get("heating_power_request") or 0,
+        room.get("therm_measured_temperature"),
+        bool(room.get("open_window")),
+        room.get("reachable") is False,
+    )
+
+
+class HomeAggregates:
+    """Heating demand, temperatures and alert counts of a home.
+
+    ``update`` compares each room with its previous contribution and only
+    applies the difference, so a refresh where few rooms changed costs a
+    few additions; nothing iterates over every room's entities.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty aggregates."""
+        self._rooms: dict[str, _Contribution] = {}
+        self.heating_power_total = 0
+        self.rooms_heating = 0
+        self.open_windows = 0
+        self.unreachable_rooms = 0
+        self._temperature_sum = 0.0
+        self._temperatures: Counter[float] = Counter()
+        self._min_temperature: float | None = None
+
+    @property
+    def rooms(self) -> int:
+        """Return the number of rooms."""
+        return len(self._rooms)
+
+    @property
+    def heating_demand(self) -> int | None:
+        """Return the total heating power request of the rooms.
+
+        It is the sum of their percentages: 250 means two and a half
+        radiators' worth of full power.
+        """
+        if not self._rooms:
+            return None
+        return self.heating_power_total
+
+    @property
+    def mean_temperature(self) -> float | None:
+        """Return the mean measured temperature."""
+        count = self._temperatures.total()
+        if not count:
+            return None
+        return round(self._temperature_sum / count, 2)
+
+    @property
+    def min_temperature(self) -> float | None:
+        """Return the lowest measured temperature."""
+        return self._min_temperature
+
+    def update(self, rooms: Iterable[dict[str, Any]]) -> None:
+        """Apply a new snapshot of the rooms; absent rooms are removed."""
+        seen = set()
+        for room in rooms:
+            room_id = room.get("id")
+            seen.add(room_id)
+            contribution = _contribution(room)
+            previous = self._rooms.get(room_id)
+            if contribution == previous:
+                continue
+            if previous is not None:
+                self._apply(previous, -1)
+            self._apply(contribution, 1)
+            self._rooms[room_id] = contribution
+
+        for room_id in self._rooms.keys() - seen:
+            self._apply(self._rooms.pop(room_id), -1)
+
+    def _apply(self, contribution: _Contribution, sign: int) -> None:
+        """Add (``sign`` 1) or remove (``sign`` -1) a contribution."""
+        self.heating_power_total += sign * contribution.heating_power
+        self.rooms_heating += sign * (contribution.heating_power > 0)
+        self.open_windows += sign * contribution.open_window
+        self.unreachable_rooms += sign * contribution.unreachable
+
+        temperature = contribution.temperature
+        if temperature is None:
+            return
+        self._temperature_sum += sign * temperature
+        self._temperatures[temperature] += sign
+        if sign > 0:
+            if self._min_temperature is None or temperature < self._min_temperature:
+                self._min_temperature = temperature
+        elif self._temperatures[temperature] <= 0:
+            del self._temperatures[temperature]
+            if temperature == self._min_temperature:
+                # Only distinct values are scanned, a handful at 0.1 °C steps
+                self._min_temperature = min(self._temperatures, default=None)
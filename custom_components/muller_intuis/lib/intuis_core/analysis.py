@@ -0,0 +1,138 @@
+"""Weekly schedule analysis: time spent at each setpoint, per room."""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import MINUTES_PER_WEEK, ZONE_TYPES_COMFORT, ZONE_TYPES_ECO
+from .models import Schedule, Zone
+
+
+def zone_minutes(timetable: list[dict[str, Any]]) -> dict[int, int]:
+    """Return the minutes per week spent in each zone of a timetable.
+
+    Each entry lasts until the next one; the last one wraps around to the
+    first entry of the next week, which also covers the start of the week
+    when the first ``m_offset`` is not 0. Cost is linear in the number of
+    entries, independent of the time resolution.
+    """
+    entries = sorted(timetable, key=lambda entry: entry["m_offset"])
+    minutes: dict[int, int] = {}
+    for index, entry in enumerate(entries):
+        if index + 1 < len(entries):
+            end = entries[index + 1]["m_offset"]
+        else:
+            end = entries[0]["m_offset"] + MINUTES_PER_WEEK
+        minutes[entry["zone_id"]] = minutes.get(entry["zone_id"], 0) + end - entry["m_offset"]
+    return minutes
+
+
+def zone_setpoints(zone: Zone) -> dict[str, float]:
+    """Return ``room_id -> setpoint`` of a zone, in either API layout."""
+    setpoints = {}
+    for room in zone.get("rooms", []):
+        if "therm_setpoint_temperature" in room:
+            setpoints[room.get("id") or room.get("room_id")] = room["therm_setpoint_temperature"]
+    for room in zone.get("rooms_temp", []):
+        if "temp" in room:
+            setpoints[room.get("room_id") or room.get("id")] = room["temp"]
+    return setpoints
+
+
+def _category(zone: Zone) -> str:
+    """Return comfort, eco or other for a zone type."""
+    if zone.get("type") in ZONE_TYPES_COMFORT:
+        return "comfort"
+    if zone.get("type") in ZONE_TYPES_ECO:
+        return "eco"
+    return "other"
+
+
+def analyze_schedule(
+    schedule: Schedule | dict[str, Any], room_names: dict[str, str] | None = None
+) -> dict[str, Any]:
+    """Return the weekly hours of each zone and, per room, at each setpoint.
+
+    Per room: hours at each setpoint (keys are the setpoint as text), hours
+    in comfort, eco and other zones, and the time weighted mean setpoint.
+    """
+    room_names = room_names or {}
+    zones = {zone["id"]: zone for zone in schedule.get("zones", []) if "id" in zone}
+    minutes = zone_minutes(schedule.get("timetable", []))
+
+    rooms: dict[str, dict[str, Any]] = {}
+    for zone_id, zone_total in minutes.items():
+        zone = zones.get(zone_id)
+        if zone is None:
+            continue
+        category = _category(zone)
+        for room_id, setpoint in zone_setpoints(zone).items():
+            room = rooms.setdefault(
+                room_id,
+                {
+                    "name": room_names.get(room_id, room_id),
+                    "setpoints": {},
+                    "comfort_hours": 0.0,
+                    "eco_hours": 0.0,
+                    "other_hours": 0.0,
+                    "_degree_minutes": 0.0,
+                    "_minutes": 0,
+                },
+            )
+            key = f"{float(setpoint):g}"
+            room["setpoints"][key] = room["setpoints"].get(key, 0.0) + zone_total / 60
+            room[f"{category}_hours"] += zone_total / 60
+            room["_degree_minutes"] += setpoint * zone_total
+            room["_minutes"] += zone_total
+
+    for room in rooms.values():
+        weighted, total = room.pop("_degree_minutes"), room.pop("_minutes")
+        room["mean_setpoint"] = round(weighted / total, 2) if total else None
+        room["setpoints"] = {
+            setpoint: round(hours, 2) for setpoint, hours in sorted(
+                room["setpoints"].items(), key=lambda item: float(item[0])
+            )
+        }
+        for category in ("comfort", "eco", "other"):
+            room[f"{category}_hours"] = round(room[f"{category}_hours"], 2)
+
+    return {
+        "id": schedule.get("id"),
+        "name": schedule.get("name"),
+        "zones": {
+            str(zone_id): {
+                "name": zones.get(zone_id, {}).get("name"),
+                "type": zones.get(zone_id, {}).get("type"),
+                "hours": round(total / 60, 2),
+            }
+            for zone_id, total in sorted(minutes.items())
+        },
+        "rooms": rooms,
+    }
+
+
+def compare_analyses(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Return, per room, the change from ``before`` to ``after``.
+
+    Rooms missing from one schedule count as zero hours there and have no
+    mean setpoint change.
+    """
+    changes = {}
+    for room_id in sorted(before["rooms"].keys() | after["rooms"].keys()):
+        old = before["rooms"].get(room_id, {})
+        new = after["rooms"].get(room_id, {})
+        old_mean, new_mean = old.get("mean_setpoint"), new.get("mean_setpoint")
+        changes[room_id] = {
+            "name": new.get("name") or old.get("name"),
+            "mean_setpoint": (
+                round(new_mean - old_mean, 2)
+                if old_mean is not None and new_mean is not None
+                else None
+            ),
+            **{
+                f"{category}_hours": round(
+                    new.get(f"{category}_hours", 0.0) - old.get(f"{category}_hours", 0.0), 2
+                )
+                for category in ("comfort", "eco", "other")
+            },
+        }
+    return changes
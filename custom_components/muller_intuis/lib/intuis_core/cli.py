@@ -0,0 +1,183 @@
+"""Command-line tool built on the API client.
+
+Run without Home Assistant by putting the integration directory on the path::
+
+    export PYTHONPATH=custom_components/muller_intuis/lib
+    python -m intuis_core homesdata
+    python -m intuis_core apply rooms.yaml
+    python -m intuis_core bench --iterations 200 --concurrency 4
+    python -m intuis_core bench --replay traffic.jsonl --speed 0
+
+Credentials come from the ``MULLER_CLIENT_ID``, ``MULLER_CLIENT_SECRET``,
+``MULLER_USERNAME`` and ``MULLER_PASSWORD`` environment variables or the
+matching options. They are not needed with ``--replay``, which serves a
+recording made with the ``record_traffic`` option instead of the cloud.
+``--token-file`` keeps the tokens between runs.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from .client import MullerIntuisApiClient, build_room_state
+from .exceptions import IntuisError
+from .recording import ReplayExhausted, ReplaySession, TrafficRecorder
+from .storage import JsonFileTokenStore
+
+
+def _load_changes(path: str) -> list[dict[str, Any]]:
+    """Load room changes from a JSON or YAML file.
+
+    The file holds a list of rooms (or a mapping with a ``rooms`` list), each
+    with ``id``, ``mode`` and optionally ``temp`` and ``duration`` (minutes).
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    if path.endswith((".yaml", ".yml")):
+        import yaml  # Shipped with Home Assistant
+
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+
+    if isinstance(data, dict):
+        data = data.get("rooms", [])
+    return [
+        build_room_state(str(room["id"]), room["mode"], room.get("temp"), room.get("duration"))
+        for room in data
+    ]
+
+
+async def _first_home_id(client: MullerIntuisApiClient) -> str:
+    """Return the id of the first home of the account."""
+    homes = (await client.get_homes_data()).get("body", {}).get("homes", [])
+    if not homes:
+        raise SystemExit("No homes found in account")
+    return homes[0]["id"]
+
+
+async def _bench(client: MullerIntuisApiClient, home_id: str, args: argparse.Namespace) -> None:
+    """Poll homestatus and report latency percentiles and throughput."""
+    latencies: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for iteration in range(args.iterations):
+        queue.put_nowait(iteration)
+
+    async def worker() -> None:
+        while not queue.empty():
+            queue.get_nowait()
+            started = time.perf_counter()
+            await client.get_home_status(home_id)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    print(f"requests:    {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.1f} req/s)")
+    print(f"latency p50: {cuts[49] * 1000:.1f} ms")
+    print(f"latency p95: {cuts[94] * 1000:.1f} ms")
+    print(f"latency max: {max(latencies) * 1000:.1f} ms")
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run the selected command."""
+    if args.replay:
+        session: Any = ReplaySession.from_file(args.replay, speed=args.speed, loop=True)
+        credentials = ("replay", "replay", "replay", "replay")
+    else:
+        credentials = (args.client_id, args.client_secret, args.username, args.password)
+        if not all(credentials):
+            raise SystemExit("Missing credentials (see --help)")
+        session = aiohttp.ClientSession()
+
+    token_store = JsonFileTokenStore(args.token_file) if args.token_file else None
+    client = MullerIntuisApiClient(session, *credentials, token_store=token_store)
+
+    try:
+        await client.async_load_tokens()
+        if args.record:
+            client.recorder = TrafficRecorder(args.record)
+
+        if args.command == "auth":
+            expires_at = await client.async_authenticate()
+            print(f"Authenticated, token valid until {time.ctime(expires_at)}")
+            return
+
+        if args.command == "homesdata":
+            print(json.dumps(await client.get_homes_data(), indent=2, ensure_ascii=False))
+            return
+
+        home_id = args.home_id or await _first_home_id(client)
+        if args.command == "homestatus":
+            print(json.dumps(await client.get_home_status(home_id), indent=2, ensure_ascii=False))
+        elif args.command == "apply":
+            rooms_data = _load_changes(args.file)
+            result = await client.set_rooms_state(home_id, rooms_data)
+            print(f"{len(rooms_data)} rooms updated in one request: {result.get('status')}")
+        elif args.command == "bench":
+            await _bench(client, home_id, args)
+    finally:
+        if client.recorder is not None:
+            await client.recorder.async_close()
+        await session.close()
+
+
+def _positive_int(value: str) -> int:
+    """Parse an integer option that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main() -> int:
+    """Parse the command line and run it."""
+    parser = argparse.ArgumentParser(
+        prog="intuis_core", description="Muller Intuis Connect API tool"
+    )
+    parser.add_argument("--client-id", default=os.environ.get("MULLER_CLIENT_ID"))
+    parser.add_argument("--client-secret", default=os.environ.get("MULLER_CLIENT_SECRET"))
+    parser.add_argument("--username", default=os.environ.get("MULLER_USERNAME"))
+    parser.add_argument("--password", default=os.environ.get("MULLER_PASSWORD"))
+    parser.add_argument("--home-id", help="home to use (default: first home)")
+    parser.add_argument("--replay", metavar="FILE", help="serve a traffic recording instead of the cloud")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed factor, 0 = no latency")
+    parser.add_argument("--record", metavar="FILE", help="record the traffic to a JSON-lines file")
+    parser.add_argument("--token-file", metavar="FILE", help="keep the tokens in this file between runs")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("auth", help="check the credentials")
+    commands.add_parser("homesdata", help="dump homesdata")
+    commands.add_parser("homestatus", help="dump homestatus")
+    apply = commands.add_parser("apply", help="apply room changes in one setstate call")
+    apply.add_argument("file", help="JSON or YAML list of {id, mode, temp, duration}")
+    bench = commands.add_parser("bench", help="timed homestatus polling benchmark")
+    bench.add_argument("--iterations", type=_positive_int, default=50)
+    bench.add_argument("--concurrency", type=_positive_int, default=1)
+
+    args = parser.parse_args()
+    try:
+        asyncio.run(_run(args))
+    except IntuisError as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 1
+    except ReplayExhausted as err:
+        print(f"Error: the recording has no response for this request ({err})", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
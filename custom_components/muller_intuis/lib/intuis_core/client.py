@@ -0,0 +1,620 @@
+"""Muller Intuitiv API client."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import aiohttp
+
+from .const import (
+    API_AUTH_URL,
+    API_HOMESDATA_URL,
+    API_HOMESTATUS_URL,
+    API_SETSTATE_URL,
+    API_SETTHERMMODE_URL,
+    API_SWITCHHOMESCHEDULE_URL,
+    AUTH_REJECTED_STATUSES,
+    COMMAND_TIMEOUT_SECONDS,
+    CONNECT_TIMEOUT_SECONDS,
+    GLOBAL_MAX_CONCURRENT_REQUESTS,
+    MAX_CONCURRENT_REQUESTS,
+    OAUTH_GRANT_TYPE,
+    OAUTH_SCOPE,
+    OAUTH_USER_PREFIX,
+    READ_TIMEOUT_SECONDS,
+    REQUEST_TIMEOUT_SECONDS,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF_SECONDS,
+    TOKEN_REFRESH_MARGIN_SECONDS,
+)
+from .exceptions import (
+    IntuisApiError,
+    IntuisAuthError,
+    IntuisError,
+    IntuisTokenRejectedError,
+    IntuisTransientError,
+)
+from .metrics import (
+    OUTCOME_API_ERROR,
+    OUTCOME_AUTH_ERROR,
+    OUTCOME_CANCELLED,
+    OUTCOME_NETWORK_ERROR,
+    OUTCOME_OK,
+    OUTCOME_SERVER_ERROR,
+    OUTCOME_TIMEOUT,
+    RequestMetrics,
+)
+from .models import trim_home_status
+from .recording import ReplaySession, TrafficRecorder
+from .storage import TokenStore
+
+_LOGGER = logging.getLogger(__name__)
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# (client, task) holding a request slot, see request_slot; tasks created
+# meanwhile inherit the value but not the slot, hence the task
+_SLOT_OWNER: ContextVar[tuple[Any, Any] | None] = ContextVar(
+    "intuis_request_slot_owner", default=None
+)
+
+
+def build_room_state(
+    room_id: str, mode: str, temp: float | None = None, duration: int | None = None
+) -> dict[str, Any]:
+    """Build the setstate payload of one room; ``duration`` is in minutes, 0 = permanent."""
+    room_data: dict[str, Any] = {
+        "id": room_id,
+        "therm_setpoint_mode": mode,
+    }
+
+    if temp is not None:
+        room_data["therm_setpoint_temperature"] = temp
+
+    if duration is not None:
+        if duration == 0:
+            room_data["therm_setpoint_end_time"] = 0
+        else:
+            room_data["therm_setpoint_end_time"] = int(time.time()) + (duration * 60)
+
+    return room_data
+
+
+class MullerIntuisApiClient:
+    """API client for Muller Intuitiv."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | ReplaySession,
+        client_id: str,
+        client_secret: str,
+        username: str,
+        password: str,
+        access_token: str | None = None,
+        refresh_token_value: str | None = None,
+        token_store: TokenStore | None = None,
+        request_limiter: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        ``session`` is any ``aiohttp.ClientSession`` (or a ``ReplaySession``
+        to run against recorded traffic). ``token_store`` persists this
+        account's tokens across restarts and ``request_limiter`` caps
+        requests shared with other clients.
+        """
+        self.session = session
+        self.recorder: TrafficRecorder | None = None
+        self.metrics = RequestMetrics()
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.username = username
+        self.password = password
+        self._access_token = access_token
+        self._refresh_token_value = refresh_token_value
+        self._token_expires_at = 0
+        self._token_store = token_store
+        self._token_lock = asyncio.Lock()
+        self._request_limiter = request_limiter or asyncio.Semaphore(GLOBAL_MAX_CONCURRENT_REQUESTS)
+        self.token_refresh_margin = TOKEN_REFRESH_MARGIN_SECONDS
+        self.request_timeout = REQUEST_TIMEOUT_SECONDS
+        self.command_timeout = COMMAND_TIMEOUT_SECONDS
+        self.connect_timeout = CONNECT_TIMEOUT_SECONDS
+        self.retry_attempts = RETRY_ATTEMPTS
+        self.retry_backoff = RETRY_BACKOFF_SECONDS
+        self.max_concurrent_requests = MAX_CONCURRENT_REQUESTS
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+    def configure(
+        self,
+        *,
+        token_refresh_margin: float = TOKEN_REFRESH_MARGIN_SECONDS,
+        request_timeout: float = REQUEST_TIMEOUT_SECONDS,
+        command_timeout: float = COMMAND_TIMEOUT_SECONDS,
+        retry_attempts: int = RETRY_ATTEMPTS,
+        retry_backoff: float = RETRY_BACKOFF_SECONDS,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        """Apply tuning settings; takes effect for the next request."""
+        self.token_refresh_margin = token_refresh_margin
+        self.request_timeout = request_timeout
+        self.command_timeout = command_timeout
+        self.retry_attempts = retry_attempts
+        self.retry_backoff = retry_backoff
+
+        if max_concurrent != self.max_concurrent_requests:
+            # Requests holding the old semaphore release it normally
+            self.max_concurrent_requests = max_concurrent
+            self._request_semaphore = asyncio.Semaphore(max_concurrent)
+
+    def update_credentials(self, client_id: str, client_secret: str, password: str) -> None:
+        """Use new credentials, e.g. after a reauthentication.
+
+        The current token is dropped when they changed, so the next request
+        logs in with them.
+        """
+        if (client_id, client_secret, password) == (self.client_id, self.client_secret, self.password):
+            return
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.password = password
+        self._access_token = None
+        self._token_expires_at = 0
+
+    async def async_load_tokens(self) -> None:
+        """Load the tokens saved by a previous run, if still usable."""
+        if self._token_store is None:
+            return
+        data = await self._token_store.async_load()
+        if data and data.get("access_token"):
+            self._access_token = data["access_token"]
+            self._refresh_token_value = data.get("refresh_token", self._refresh_token_value)
+            self._token_expires_at = data.get("expires_at", 0)
+
+    @property
+    def tokens(self) -> dict[str, Any]:
+        """Return the current tokens, as saved to the token store."""
+        return {
+            "access_token": self._access_token,
+            "refresh_token": self._refresh_token_value,
+            "expires_at": self._token_expires_at,
+        }
+
+    async def _async_save_tokens(self) -> None:
+        """Persist the current tokens."""
+        if self._token_store is None:
+            return
+        await self._token_store.async_save(self.tokens)
+
+    async def _refresh_token(self) -> None:
+        """Get a new access token by logging in with the stored credentials."""
+        auth_data = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "username": self.username,
+            "password": self.password,
+            "grant_type": OAUTH_GRANT_TYPE,
+            "user_prefix": OAUTH_USER_PREFIX,
+            "scope": OAUTH_SCOPE,
+        }
+
+        headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+
+        try:
+            timeout = self._timeout(API_AUTH_URL, self.request_timeout)
+            async with self.session.post(
+                API_AUTH_URL,
+                data=auth_data,
+                headers=headers,
+                timeout=timeout,
+            ) as response:
+                if response.status in AUTH_REJECTED_STATUSES:
+                    error_text = await response.text()
+                    _LOGGER.error("Token refresh failed: %s - %s", response.status, error_text)
+                    raise IntuisAuthError("Token refresh failed")
+
+                # Throttling or an outage is not a credential problem: retry
+                # it instead of starting a reauth flow
+                if response.status == 429 or response.status >= 500:
+                    _LOGGER.debug("Token refresh unavailable: %s", response.status)
+                    raise IntuisTransientError(f"Token refresh failed: {response.status}")
+
+                if response.status != 200:
+                    error_text = await response.text()
+                    _LOGGER.error("Token refresh failed: %s - %s", response.status, error_text)
+                    raise IntuisApiError(f"Token refresh failed: {response.status}")
+
+                data = await response.json()
+
+                if "access_token" not in data:
+                    raise IntuisAuthError("No access_token in response")
+
+                self._access_token = data["access_token"]
+                self._refresh_token_value = data.get("refresh_token", self._refresh_token_value)
+                
+                expires_in = data.get("expires_in", 10800)
+                self._token_expires_at = time.time() + expires_in
+
+                _LOGGER.info("Token refreshed successfully")
+
+            await self._async_save_tokens()
+
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Connection error during token refresh: %s", err)
+            raise IntuisApiError(f"Connection error: {err}") from err
+
+    async def async_authenticate(self) -> float:
+        """Make sure a valid access token is held; return its expiry timestamp.
+
+        Logs in only when the current token is missing or about to expire.
+        """
+        await self._ensure_token_valid()
+        return self._token_expires_at
+
+    async def _ensure_token_valid(self) -> None:
+        """Ensure the access token is valid."""
+        if not self._token_needs_refresh():
+            return
+        # Concurrent requests wait for a single refresh instead of each doing one
+        async with self._token_lock:
+            if self._token_needs_refresh():
+                await self._refresh_token()
+
+    def _token_needs_refresh(self) -> bool:
+        """Return True if the access token is missing or about to expire."""
+        return (
+            not self._access_token
+            or time.time() >= (self._token_expires_at - self.token_refresh_margin)
+        )
+
+    def _timeout(self, url: str, total: float) -> aiohttp.ClientTimeout:
+        """Return the deadlines of one attempt: connect, per-endpoint read, total."""
+        return aiohttp.ClientTimeout(
+            total=total,
+            connect=min(self.connect_timeout, total),
+            sock_read=min(READ_TIMEOUT_SECONDS.get(url, total), total),
+        )
+
+    @asynccontextmanager
+    async def request_slot(self) -> AsyncIterator[None]:
+        """Hold a request slot of this client and of the shared limiter.
+
+        Requests sent by the holding task use this slot instead of waiting
+        for another one, so a caller can decide what to send only once the
+        request can go out.
+        """
+        owner = (self, asyncio.current_task())
+        if _SLOT_OWNER.get() == owner:
+            yield
+            return
+        async with self._request_semaphore, self._request_limiter:
+            token = _SLOT_OWNER.set(owner)
+            try:
+                yield
+            finally:
+                _SLOT_OWNER.reset(token)
+
+    async def _api_request(
+        self, url: str, method: str = "POST", data: dict | None = None
+    ) -> dict[str, Any]:
+        """Make an API request, retrying transient failures.
+
+        A rejected access token (revoked or rotated server side) triggers one
+        login with the stored credentials and one replay of the request; a
+        second rejection, or a failed login, raises ``IntuisAuthError``.
+
+        Cancellation of the calling task is never retried: it propagates out
+        of the retry loop and aborts the request in flight.
+        """
+        # Reads poll state; everything else is a user-visible command
+        timeout = self._timeout(
+            url, self.request_timeout if method == "GET" else self.command_timeout
+        )
+        attempt = 0
+        replayed = False
+
+        while True:
+            try:
+                async with self.request_slot():
+                    return await self._send_measured_request(url, method, data, timeout)
+            except IntuisTokenRejectedError:
+                if replayed:
+                    raise
+                replayed = True
+                _LOGGER.info("Access token rejected, logging in again")
+            except (IntuisTransientError, aiohttp.ClientError, TimeoutError) as err:
+                if attempt >= self.retry_attempts:
+                    _LOGGER.error("API request error: %s", err)
+                    if isinstance(err, IntuisError):
+                        raise
+                    raise IntuisApiError(f"API request failed: {err}") from err
+
+                delay = self.retry_backoff * (2**attempt)
+                attempt += 1
+                self.metrics.record_retry()
+                _LOGGER.warning(
+                    "API request to %s failed (%s), retry %d/%d in %.1fs",
+                    url, err, attempt, self.retry_attempts, delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def _send_measured_request(
+        self,
+        url: str,
+        method: str,
+        data: dict | None,
+        timeout: aiohttp.ClientTimeout,
+    ) -> dict[str, Any]:
+        """Send a single API request, counting its outcome and duration."""
+        outcome = OUTCOME_API_ERROR  # Unless set below, unexpected errors included
+        started = time.monotonic()
+        try:
+            result = await self._send_request(url, method, data, timeout)
+            outcome = OUTCOME_OK
+            return result
+        except asyncio.CancelledError:
+            outcome = OUTCOME_CANCELLED
+            raise
+        except IntuisAuthError:
+            outcome = OUTCOME_AUTH_ERROR
+            raise
+        except IntuisTransientError:
+            outcome = OUTCOME_SERVER_ERROR
+            raise
+        except IntuisApiError:
+            outcome = OUTCOME_API_ERROR
+            raise
+        except aiohttp.ClientError:
+            outcome = OUTCOME_NETWORK_ERROR
+            raise
+        except TimeoutError:
+            outcome = OUTCOME_TIMEOUT
+            raise
+        finally:
+            duration = None if outcome == OUTCOME_CANCELLED else time.monotonic() - started
+            self.metrics.record(url, outcome, duration)
+
+    async def _send_request(
+        self,
+        url: str,
+        method: str,
+        data: dict | None,
+        timeout: aiohttp.ClientTimeout,
+    ) -> dict[str, Any]:
+        """Send a single API request."""
+        await self._ensure_token_valid()
+        token = self._access_token
+
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        
+        kwargs: dict[str, Any] = {"headers": headers, "timeout": timeout}
+        if method == "GET":
+            kwargs["params"] = data
+        elif method == "POST_JSON":
+            headers["Content-Type"] = "application/json"
+            method = "POST"
+            kwargs["json"] = data
+        else:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+            kwargs["data"] = data
+
+        started = time.monotonic()
+        async with self.session.request(method, url, **kwargs) as response:
+            if self.recorder is not None:
+                body = await response.read()
+                self.recorder.record(
+                    method, url, data, response.status, body, time.monotonic() - started
+                )
+            try:
+                return await self._handle_response(response)
+            except IntuisTokenRejectedError:
+                # Keep a token obtained meanwhile by a concurrent request
+                if self._access_token == token:
+                    self._access_token = None
+                raise
+
+    async def _handle_response(self, response: aiohttp.ClientResponse) -> dict[str, Any]:
+        """Handle API response."""
+        if response.status == 401:
+            raise IntuisTokenRejectedError("Authentication failed")
+
+        if response.status >= 500:
+            error_text = await response.text()
+            _LOGGER.debug("API server error: %s - %s", response.status, error_text)
+            raise IntuisTransientError(f"API error: {response.status}")
+
+        if response.status != 200:
+            error_text = await response.text()
+            _LOGGER.error("API error: %s - %s", response.status, error_text)
+            raise IntuisApiError(f"API error: {response.status}")
+
+        # Decode the raw body directly: faster than response.json() with orjson
+        data = json_loads(await response.read())
+
+        if data.get("status") != "ok":
+            error = data.get("error", {})
+            error_msg = error.get("message", "Unknown error")
+            _LOGGER.error("API returned error: %s", error_msg)
+            raise IntuisApiError(f"API error: {error_msg}")
+
+        return data
+
+    async def get_homes_data(self) -> dict[str, Any]:
+        """Get homes data (static info: rooms, modules, schedules)."""
+        return await self._api_request(API_HOMESDATA_URL, method="GET")
+
+    async def get_home_status(
+        self,
+        home_id: str,
+        device_types: Iterable[str] | None = None,
+        trim: bool = False,
+    ) -> dict[str, Any]:
+        """Get home status (real-time: temperatures, states).
+
+        ``device_types`` asks the backend for these module types only. With
+        ``trim``, the home keeps only the fields listed in
+        ``HOME_STATUS_FIELDS``, ``ROOM_STATUS_FIELDS`` and
+        ``MODULE_STATUS_FIELDS``, so snapshots held between polls stay small.
+        """
+        params = {"home_id": home_id}
+        if device_types:
+            params["device_types"] = ",".join(device_types)
+
+        data = await self._api_request(API_HOMESTATUS_URL, method="GET", data=params)
+
+        if trim and "home" in data.get("body", {}):
+            data["body"]["home"] = trim_home_status(data["body"]["home"])
+        return data
+
+    async def set_room_state(
+        self, home_id: str, room_id: str, mode: str, temp: float | None = None, duration: int | None = None
+    ) -> dict[str, Any]:
+        """Set room state (temperature setpoint and mode)."""
+        _LOGGER.debug("Setting room state: home=%s, room=%s, mode=%s, temp=%s, duration=%s", 
+                     home_id, room_id, mode, temp, duration)
+        
+        room_data = build_room_state(room_id, mode, temp, duration)
+        
+        payload = {
+            "home": {
+                "id": home_id,
+                "rooms": [room_data]
+            }
+        }
+
+        return await self._api_request(API_SETSTATE_URL, data=payload, method="POST_JSON")
+
+    async def set_all_rooms_off(self, home_id: str, rooms: list[dict]) -> dict[str, Any]:
+        """Set all rooms to OFF mode."""
+        _LOGGER.debug("Setting ALL rooms to OFF for home %s (%d rooms)", home_id, len(rooms))
+        
+        rooms_data = []
+        for room in rooms:
+            room_id = room.get("id")
+            if room_id:
+                rooms_data.append({
+                    "id": room_id,
+                    "therm_setpoint_mode": "off",
+                })
+        
+        if not rooms_data:
+            _LOGGER.warning("No rooms to set OFF")
+            return {"status": "ok"}
+        
+        payload = {
+            "home": {
+                "id": home_id,
+                "rooms": rooms_data
+            }
+        }
+        
+        _LOGGER.info("Sending OFF command to %d rooms", len(rooms_data))
+        return await self._api_request(API_SETSTATE_URL, data=payload, method="POST_JSON")
+    
+    async def set_all_rooms_mode(self, home_id: str, rooms: list[dict], mode: str) -> dict[str, Any]:
+        """Set all rooms to a specific mode."""
+        _LOGGER.debug("Setting ALL rooms to mode %s for home %s (%d rooms)", mode, home_id, len(rooms))
+        
+        rooms_data = []
+        for room in rooms:
+            room_id = room.get("id")
+            if room_id:
+                rooms_data.append({
+                    "id": room_id,
+                    "therm_setpoint_mode": mode,
+                })
+        
+        if not rooms_data:
+            _LOGGER.warning("No rooms to set to mode %s", mode)
+            return {"status": "ok"}
+        
+        payload = {
+            "home": {
+                "id": home_id,
+                "rooms": rooms_data
+            }
+        }
+        
+        _LOGGER.info("Sending mode %s command to %d rooms", mode, len(rooms_data))
+        return await self._api_request(API_SETSTATE_URL, data=payload, method="POST_JSON")
+
+    async def set_rooms_state(
+        self, home_id: str, rooms_data: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Set the state of several rooms in a single setstate call.
+
+        Items are room payloads as returned by ``build_room_state``.
+        """
+        if not rooms_data:
+            _LOGGER.warning("No rooms to update")
+            return {"status": "ok"}
+
+        payload = {
+            "home": {
+                "id": home_id,
+                "rooms": rooms_data
+            }
+        }
+
+        _LOGGER.info("Sending state of %d rooms", len(rooms_data))
+        return await self._api_request(API_SETSTATE_URL, data=payload, method="POST_JSON")
+
+    async def set_therm_mode(
+        self, home_id: str, mode: str, end_time: int | None = None
+    ) -> dict[str, Any]:
+        """Set home thermostat mode."""
+        
+        # Validation endtime : ne pas envoyer si None, sinon vérifier validité
+        if end_time is not None and end_time != 0:
+            now = int(time.time())
+            min_time = now + 300  # 5 minutes dans le futur minimum
+            
+            if end_time < min_time:
+                _LOGGER.warning(
+                    "endtime %s is in the past or too soon, removing it (permanent mode)",
+                    end_time
+                )
+                end_time = None  # Mode permanent
+        elif end_time == 0:
+            # endtime=0 signifie permanent, ne pas l'envoyer
+            _LOGGER.debug("endtime=0 detected, removing it (permanent mode)")
+            end_time = None
+        
+        _LOGGER.debug("Setting home therm mode: home=%s, mode=%s, endtime=%s", home_id, mode, end_time)
+        
+        data = {
+            "home_id": home_id,
+            "mode": mode,
+        }
+        
+        if end_time is not None:
+            data["endtime"] = end_time
+
+        return await self._api_request(API_SETTHERMMODE_URL, data=data)
+
+    async def switch_home_schedule(
+        self, home_id: str, schedule_id: str
+    ) -> dict[str, Any]:
+        """Switch the active home schedule."""
+        _LOGGER.debug("Switching home schedule: home=%s, schedule=%s", home_id, schedule_id)
+        
+        payload = {
+            "app_identifier": "app_muller",
+            "home_id": home_id,
+            "schedule_id": schedule_id,
+            "schedule_type": "therm"
+        }
+
+        return await self._api_request(API_SWITCHHOMESCHEDULE_URL, data=payload, method="POST_JSON")
@@ -0,0 +1,103 @@
+"""Constants for the Muller Intuitiv API."""
+
+# API endpoints
+API_BASE_URL = "https://app.muller-intuitiv.net"
+API_AUTH_URL = f"{API_BASE_URL}/oauth2/token"
+API_HOMESDATA_URL = f"{API_BASE_URL}/api/homesdata"
+API_HOMESTATUS_URL = f"{API_BASE_URL}/api/homestatus"
+API_SETSTATE_URL = f"{API_BASE_URL}/syncapi/v1/setstate"
+API_SETTHERMMODE_URL = f"{API_BASE_URL}/api/setthermmode"
+API_SWITCHHOMESCHEDULE_URL = f"{API_BASE_URL}/api/switchhomeschedule"
+
+# OAuth2 parameters
+OAUTH_USER_PREFIX = "muller"
+OAUTH_SCOPE = "read_muller write_muller"
+OAUTH_GRANT_TYPE = "password"
+AUTH_REJECTED_STATUSES = (400, 401, 403)  # Login answers meaning bad credentials
+
+TOKEN_REFRESH_MARGIN_SECONDS = 300  # 5 minutes before expiry
+
+# HTTP client tuning
+REQUEST_TIMEOUT_SECONDS = 30  # homesdata / homestatus / oauth2
+COMMAND_TIMEOUT_SECONDS = 30  # setstate / setthermmode / switchhomeschedule
+MAX_CONCURRENT_REQUESTS = 4  # Per account
+GLOBAL_MAX_CONCURRENT_REQUESTS = 8  # Shared by all accounts
+RETRY_ATTEMPTS = 0  # Extra attempts after a transient failure
+RETRY_BACKOFF_SECONDS = 2.0  # Doubled after each failed attempt
+COMMAND_DEBOUNCE_SECONDS = 0.3  # Wait for further intents before sending a room command
+CONNECT_TIMEOUT_SECONDS = 10  # TCP + TLS connection, every endpoint
+
+# Maximum wait for response data, per endpoint; the total per request stays
+# bounded by the request/command timeout
+READ_TIMEOUT_SECONDS = {
+    API_AUTH_URL: 10,
+    API_HOMESDATA_URL: 20,  # Large payload: rooms, modules and schedules
+    API_HOMESTATUS_URL: 10,
+    API_SETSTATE_URL: 10,
+    API_SETTHERMMODE_URL: 10,
+    API_SWITCHHOMESCHEDULE_URL: 10,
+}
+
+# homestatus fields kept when trimming a snapshot; everything else is dropped
+HOME_STATUS_FIELDS = ("id", "therm_mode", "therm_mode_endtime", "rooms", "modules")
+ROOM_STATUS_FIELDS = (
+    "id",
+    "reachable",
+    "anticipating",
+    "open_window",
+    "heating_power_request",
+    "therm_measured_temperature",
+    "therm_setpoint_temperature",
+    "therm_setpoint_mode",
+    "therm_setpoint_start_time",
+    "therm_setpoint_end_time",
+)
+MODULE_STATUS_FIELDS = ("id", "type", "bridge", "reachable")
+
+# Modes for rooms (individual heaters)
+MODE_MANUAL = "manual"
+MODE_HOME = "home"  # Follow house schedule
+MODE_OFF = "off"    # Turn off this room
+MODE_HG = "hg"      # Frost protection for this room
+
+# Modes for home (entire house)
+MODE_SCHEDULE = "schedule"  # Follow active schedule
+MODE_AWAY = "away"         # Away mode
+MODE_HOME_HG = "hg"        # Frost protection for entire home
+
+# Schedules
+SCHEDULE_TYPE_THERM = "therm"
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY  # Timetable m_offset range, from Monday 00:00
+
+# Schedule zone types
+ZONE_TYPE_COMFORT = 0
+ZONE_TYPE_NIGHT = 1
+ZONE_TYPE_CUSTOM = 4
+ZONE_TYPE_ECO = 5
+ZONE_TYPE_COMFORT_PLUS = 8
+ZONE_TYPES_COMFORT = (ZONE_TYPE_COMFORT, ZONE_TYPE_COMFORT_PLUS)
+ZONE_TYPES_ECO = (ZONE_TYPE_NIGHT, ZONE_TYPE_ECO)
+
+# Room transitions detected between two homestatus snapshots
+TRANSITION_WINDOW_OPENED = "window_opened"
+TRANSITION_WINDOW_CLOSED = "window_closed"
+TRANSITION_ROOM_UNREACHABLE = "room_unreachable"
+TRANSITION_ROOM_REACHABLE = "room_reachable"
+TRANSITION_ANTICIPATION_STARTED = "anticipation_started"
+TRANSITION_ANTICIPATION_ENDED = "anticipation_ended"
+TRANSITION_OVERRIDE_STARTED = "override_started"
+TRANSITION_OVERRIDE_EXPIRED = "override_expired"  # Manual mode reached its end time
+TRANSITION_OVERRIDE_CANCELLED = "override_cancelled"  # Manual mode left before its end time
+
+TRANSITIONS = (
+    TRANSITION_WINDOW_OPENED,
+    TRANSITION_WINDOW_CLOSED,
+    TRANSITION_ROOM_UNREACHABLE,
+    TRANSITION_ROOM_REACHABLE,
+    TRANSITION_ANTICIPATION_STARTED,
+    TRANSITION_ANTICIPATION_ENDED,
+    TRANSITION_OVERRIDE_STARTED,
+    TRANSITION_OVERRIDE_EXPIRED,
+    TRANSITION_OVERRIDE_CANCELLED,
+)
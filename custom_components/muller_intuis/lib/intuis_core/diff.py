@@ -0,0 +1,75 @@
+"""Room transitions derived from consecutive homestatus snapshots."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from .const import (
+    MODE_MANUAL,
+    TRANSITION_ANTICIPATION_ENDED,
+    TRANSITION_ANTICIPATION_STARTED,
+    TRANSITION_OVERRIDE_CANCELLED,
+    TRANSITION_OVERRIDE_EXPIRED,
+    TRANSITION_OVERRIDE_STARTED,
+    TRANSITION_ROOM_REACHABLE,
+    TRANSITION_ROOM_UNREACHABLE,
+    TRANSITION_WINDOW_CLOSED,
+    TRANSITION_WINDOW_OPENED,
+)
+
+# Boolean room fields: (field, transition when set, transition when cleared)
+_FLAG_TRANSITIONS = (
+    ("open_window", TRANSITION_WINDOW_OPENED, TRANSITION_WINDOW_CLOSED),
+    ("reachable", TRANSITION_ROOM_REACHABLE, TRANSITION_ROOM_UNREACHABLE),
+    ("anticipating", TRANSITION_ANTICIPATION_STARTED, TRANSITION_ANTICIPATION_ENDED),
+)
+
+
+def room_transitions(
+    previous: dict[str, Any], current: dict[str, Any], now: float
+) -> list[str]:
+    """Return the transitions of one room between two snapshots.
+
+    A field missing from either snapshot never produces a transition.
+    """
+    transitions = []
+
+    for field, set_transition, cleared_transition in _FLAG_TRANSITIONS:
+        before = previous.get(field)
+        after = current.get(field)
+        if before is None or after is None or bool(before) == bool(after):
+            continue
+        transitions.append(set_transition if after else cleared_transition)
+
+    was_manual = previous.get("therm_setpoint_mode") == MODE_MANUAL
+    is_manual = current.get("therm_setpoint_mode") == MODE_MANUAL
+    if is_manual and not was_manual:
+        transitions.append(TRANSITION_OVERRIDE_STARTED)
+    elif was_manual and not is_manual:
+        end_time = previous.get("therm_setpoint_end_time") or 0
+        if end_time and now >= end_time:
+            transitions.append(TRANSITION_OVERRIDE_EXPIRED)
+        else:
+            transitions.append(TRANSITION_OVERRIDE_CANCELLED)
+
+    return transitions
+
+
+def diff_rooms(
+    previous: dict[str, dict[str, Any]],
+    current: Iterable[dict[str, Any]],
+    now: float,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Return ``(transition, room)`` pairs between two snapshots.
+
+    ``previous`` maps room ids to the rooms of the last snapshot; rooms
+    absent from it (first snapshot, newly added room) are skipped.
+    """
+    changes = []
+    for room in current:
+        before = previous.get(room.get("id"))
+        if before is None:
+            continue
+        for transition in room_transitions(before, room, now):
+            changes.append((transition, room))
+    return changes
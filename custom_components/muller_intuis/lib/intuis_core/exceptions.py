@@ -0,0 +1,21 @@
+"""Exceptions raised by the Muller Intuitiv API client."""
+
+
+class IntuisError(Exception):
+    """Base class for Muller Intuitiv errors."""
+
+
+class IntuisAuthError(IntuisError):
+    """Error raised when the credentials or tokens are rejected."""
+
+
+class IntuisTokenRejectedError(IntuisAuthError):
+    """Error raised when the API rejects the access token (HTTP 401)."""
+
+
+class IntuisApiError(IntuisError):
+    """Error raised when a request fails or the API reports an error."""
+
+
+class IntuisTransientError(IntuisApiError):
+    """Error raised for failures that may succeed when retried."""
@@ -0,0 +1,146 @@
+"""Request counters and Prometheus text rendering."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
+
+from .models import rooms_by_id
+
+# Outcomes counted by RequestMetrics
+OUTCOME_OK = "ok"
+OUTCOME_AUTH_ERROR = "auth_error"
+OUTCOME_API_ERROR = "api_error"
+OUTCOME_SERVER_ERROR = "server_error"
+OUTCOME_NETWORK_ERROR = "network_error"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_CANCELLED = "cancelled"  # Superseded refresh or shutdown, not an API failure
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_PREFIX = "muller_intuis"
+
+
+class RequestMetrics:
+    """Counters of the API requests sent by one client.
+
+    ``generation`` changes on every recorded request, so renderings can be
+    cached until it moves.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.generation = 0
+        self.requests: dict[tuple[str, str], int] = {}
+        self.latency: dict[str, list[float]] = {}  # endpoint -> [sum, count]
+        self.retries = 0
+
+    def record(self, url: str, outcome: str, duration: float | None) -> None:
+        """Count one request attempt to ``url`` that took ``duration`` seconds.
+
+        ``duration`` is None for an attempt that did not complete (cancelled):
+        it is counted but kept out of the latency summary.
+        """
+        endpoint = urlsplit(url).path
+        key = (endpoint, outcome)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        if duration is not None:
+            latency = self.latency.setdefault(endpoint, [0.0, 0])
+            latency[0] += duration
+            latency[1] += 1
+        self.generation += 1
+
+    def record_retry(self) -> None:
+        """Count one retried request."""
+        self.retries += 1
+        self.generation += 1
+
+
+class HomeMetrics(NamedTuple):
+    """What is rendered for one home."""
+
+    home_id: str
+    status: dict[str, Any]
+    requests: RequestMetrics
+    up: bool
+
+
+# (name, type, help)
+_ROOM_TEMPERATURE = ("room_temperature_celsius", "gauge", "Measured room temperature.")
+_ROOM_SETPOINT = ("room_setpoint_celsius", "gauge", "Room setpoint temperature.")
+_ROOM_HEATING_POWER = ("room_heating_power_percent", "gauge", "Room heating power request.")
+_ROOM_OPEN_WINDOW = ("room_open_window", "gauge", "1 while an open window is detected.")
+_ROOM_REACHABLE = ("room_reachable", "gauge", "1 while the room heaters are reachable.")
+_UP = ("up", "gauge", "1 if the last refresh of the home succeeded.")
+_REQUESTS = ("api_requests_total", "counter", "API request attempts by endpoint and outcome.")
+_LATENCY = ("api_request_duration_seconds", "summary", "API request attempt duration.")
+_RETRIES = ("api_retries_total", "counter", "API requests retried after a transient failure.")
+
+_ROOM_FIELDS = (
+    (_ROOM_TEMPERATURE, "therm_measured_temperature"),
+    (_ROOM_SETPOINT, "therm_setpoint_temperature"),
+    (_ROOM_HEATING_POWER, "heating_power_request"),
+    (_ROOM_OPEN_WINDOW, "open_window"),
+    (_ROOM_REACHABLE, "reachable"),
+)
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(**labels: Any) -> str:
+    """Format a label set."""
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _number(value: Any) -> str:
+    """Format a sample value; booleans become 0/1."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(homes: Iterable[HomeMetrics]) -> str:
+    """Render room telemetry and request counters in Prometheus text format."""
+    samples: dict[tuple[str, str, str], list[str]] = {}
+
+    def add(family: tuple[str, str, str], line: str) -> None:
+        samples.setdefault(family, []).append(line)
+
+    for home in homes:
+        add(_UP, f'{_PREFIX}_{_UP[0]}{{{_labels(home_id=home.home_id)}}} {_number(home.up)}')
+
+        names = rooms_by_id(home.status.get("rooms_info", []))
+        for room in home.status.get("rooms", []):
+            room_id = room.get("id")
+            labels = _labels(
+                home_id=home.home_id,
+                room_id=room_id,
+                room=names.get(room_id, {}).get("name", room_id),
+            )
+            for family, field in _ROOM_FIELDS:
+                value = room.get(field)
+                if value is not None:
+                    add(family, f"{_PREFIX}_{family[0]}{{{labels}}} {_number(value)}")
+
+        requests = home.requests
+        for (endpoint, outcome), count in sorted(requests.requests.items()):
+            labels = _labels(home_id=home.home_id, endpoint=endpoint, outcome=outcome)
+            add(_REQUESTS, f"{_PREFIX}_{_REQUESTS[0]}{{{labels}}} {count}")
+        for endpoint, (total, count) in sorted(requests.latency.items()):
+            labels = _labels(home_id=home.home_id, endpoint=endpoint)
+            add(_LATENCY, f"{_PREFIX}_{_LATENCY[0]}_sum{{{labels}}} {_number(total)}")
+            add(_LATENCY, f"{_PREFIX}_{_LATENCY[0]}_count{{{labels}}} {count}")
+        add(
+            _RETRIES,
+            f"{_PREFIX}_{_RETRIES[0]}{{{_labels(home_id=home.home_id)}}} {requests.retries}",
+        )
+
+    lines = []
+    for (name, metric_type, help_text), family_samples in samples.items():
+        lines.append(f"# HELP {_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {_PREFIX}_{name} {metric_type}")
+        lines.extend(family_samples)
+    return "\n".join(lines) + "\n"
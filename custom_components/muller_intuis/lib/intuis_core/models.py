@@ -0,0 +1,127 @@
+"""Shapes of the Muller Intuitiv API payloads used by the client.
+
+Only the fields read by this library are described; the API returns more.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, TypedDict
+
+from .const import HOME_STATUS_FIELDS, MODULE_STATUS_FIELDS, ROOM_STATUS_FIELDS
+
+
+class RoomInfo(TypedDict, total=False):
+    """Static room description from ``homesdata``."""
+
+    id: str
+    name: str
+    type: str
+    module_ids: list[str]
+
+
+class RoomStatus(TypedDict, total=False):
+    """Real-time room state from ``homestatus``."""
+
+    id: str
+    reachable: bool
+    anticipating: bool
+    open_window: bool
+    heating_power_request: int
+    therm_measured_temperature: float
+    therm_setpoint_temperature: float
+    therm_setpoint_mode: str
+    therm_setpoint_start_time: int
+    therm_setpoint_end_time: int
+
+
+class ZoneRoom(TypedDict, total=False):
+    """Setpoint of one room within a schedule zone."""
+
+    id: str
+    room_id: str
+    therm_setpoint_temperature: float
+    temp: float
+
+
+class Zone(TypedDict, total=False):
+    """Schedule zone: a named set of room setpoints."""
+
+    id: int
+    name: str
+    type: int
+    rooms: list[ZoneRoom]
+    rooms_temp: list[ZoneRoom]
+
+
+class TimetableEntry(TypedDict):
+    """Zone applied from ``m_offset`` minutes after Monday 00:00."""
+
+    zone_id: int
+    m_offset: int
+
+
+class Schedule(TypedDict, total=False):
+    """Weekly schedule from ``homesdata``."""
+
+    id: str
+    name: str
+    type: str
+    selected: bool
+    default: bool
+    timetable: list[TimetableEntry]
+    zones: list[Zone]
+
+
+class Home(TypedDict, total=False):
+    """Home from ``homesdata`` (static) merged with ``homestatus`` fields."""
+
+    id: str
+    name: str
+    timezone: str
+    therm_mode: str
+    therm_mode_endtime: int
+    rooms: list[dict[str, Any]]
+    modules: list[dict[str, Any]]
+    schedules: list[Schedule]
+
+
+def rooms_by_id(rooms: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Index rooms by id."""
+    return {room["id"]: room for room in rooms if "id" in room}
+
+
+def merge_room(info: RoomInfo | dict[str, Any], status: RoomStatus | dict[str, Any]) -> dict[str, Any]:
+    """Merge a room's static description with its real-time state."""
+    return {**info, **status}
+
+
+def module_types(home: Home | dict[str, Any], room_ids: Iterable[str] | None = None) -> list[str]:
+    """Return the module types of a ``homesdata`` home, sorted.
+
+    With ``room_ids``, only modules of these rooms count, plus the modules
+    attached to no room (gateways).
+    """
+    scope = set(room_ids) if room_ids is not None else None
+    return sorted(
+        {
+            module["type"]
+            for module in home.get("modules", [])
+            if "type" in module
+            and (scope is None or module.get("room_id") in scope or "room_id" not in module)
+        }
+    )
+
+
+def _pick(item: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    """Return the ``fields`` of ``item`` that are present."""
+    return {field: item[field] for field in fields if field in item}
+
+
+def trim_home_status(home: dict[str, Any]) -> dict[str, Any]:
+    """Keep only the ``homestatus`` fields read by the integration."""
+    trimmed = _pick(home, HOME_STATUS_FIELDS)
+    trimmed["rooms"] = [_pick(room, ROOM_STATUS_FIELDS) for room in home.get("rooms", [])]
+    trimmed["modules"] = [
+        _pick(module, MODULE_STATUS_FIELDS) for module in home.get("modules", [])
+    ]
+    return trimmed
@@ -0,0 +1,183 @@
+"""Per-room command pipeline keeping only the latest intent."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any, AsyncContextManager, Generic, TypeVar
+
+from .const import COMMAND_DEBOUNCE_SECONDS
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class _Pending(Generic[_T]):
+    """Latest intent of a key and the callers waiting for its outcome."""
+
+    __slots__ = ("intent", "covers", "sequence", "waiters")
+
+    def __init__(self, intent: _T, covers: frozenset[Hashable], sequence: int) -> None:
+        self.intent = intent
+        self.covers = covers
+        self.sequence = sequence
+        self.waiters: list[asyncio.Future[None]] = []
+
+
+class CommandPipeline(Generic[_T]):
+    """Send commands one key (room) at a time, latest intent first.
+
+    Each key has at most one worker, so its commands go out in submission
+    order, one at a time. A worker waits ``debounce`` seconds, then for a
+    request ``slot``, and only then takes the latest intent: any intent
+    submitted meanwhile replaces the pending one (the commands are absolute
+    states, so the newer one makes it moot). A command already sent is never
+    cancelled, the cloud could still apply it after a newer one; an intent
+    submitted meanwhile goes out once it is done. However many calls a
+    gesture fires, a key costs about one request per debounce window.
+
+    A command may cover other keys (a room group write covers its rooms).
+    It absorbs their unsent intents, whose callers get its outcome, and
+    commands with a covered key in common go out one at a time, in the
+    order of their latest submission.
+
+    ``submit`` returns once the intent that replaced the caller's, or the
+    caller's own, has been sent, and raises its error if it failed.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Hashable, _T], Awaitable[Any]],
+        debounce: float = COMMAND_DEBOUNCE_SECONDS,
+        slot: Callable[[], AsyncContextManager[Any]] = contextlib.nullcontext,
+    ) -> None:
+        """Initialize the pipeline; ``send(key, intent)`` performs a command.
+
+        ``slot()`` is entered around each send, typically the API client's
+        ``request_slot`` so intents are picked when a request can go out.
+        """
+        self._send = send
+        self.debounce = debounce
+        self._slot = slot
+        self._pending: dict[Hashable, _Pending[_T]] = {}
+        self._workers: dict[Hashable, asyncio.Task] = {}
+        self._busy: set[Hashable] = set()  # Keys covered by a command in flight
+        self._sequence = 0
+        self._changed: asyncio.Future[None] | None = None
+
+    async def submit(
+        self, key: Hashable, intent: _T, covers: Iterable[Hashable] | None = None
+    ) -> None:
+        """Queue ``intent`` for ``key``, superseding any pending one.
+
+        ``covers`` are the keys the command writes, ``key`` alone by default.
+        """
+        covers = frozenset(covers) if covers is not None else frozenset((key,))
+        self._sequence += 1
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _Pending(intent, covers, self._sequence)
+        else:
+            _LOGGER.debug("Replacing the pending command of %s", key)
+            pending.intent = intent
+            pending.covers = covers
+            pending.sequence = self._sequence
+
+        for covered in covers:
+            if covered != key and (absorbed := self._pending.pop(covered, None)) is not None:
+                _LOGGER.debug("Command of %s absorbed by the one of %s", covered, key)
+                pending.waiters.extend(absorbed.waiters)
+        self._notify()
+
+        if key not in self._workers:
+            self._workers[key] = asyncio.create_task(self._run(key))
+
+        waiter = asyncio.get_running_loop().create_future()
+        pending.waiters.append(waiter)
+        await waiter
+
+    def _blocked(self, pending: _Pending[_T]) -> bool:
+        """Return True while a command overlapping ``pending`` must go first."""
+        if not pending.covers.isdisjoint(self._busy):
+            return True
+        return any(
+            other.sequence < pending.sequence and not other.covers.isdisjoint(pending.covers)
+            for other in self._pending.values()
+        )
+
+    async def _wait_for_change(self) -> None:
+        """Wait until a command is submitted or completes."""
+        if self._changed is None:
+            self._changed = asyncio.get_running_loop().create_future()
+        # asyncio.wait leaves the shared future alone if this task is cancelled
+        await asyncio.wait((self._changed,))
+
+    def _notify(self) -> None:
+        """Wake up the workers waiting for a change."""
+        if self._changed is not None:
+            self._changed.set_result(None)
+            self._changed = None
+
+    async def _run(self, key: Hashable) -> None:
+        """Send the latest intent of ``key`` until none is left."""
+        try:
+            while key in self._pending:
+                await asyncio.sleep(self.debounce)
+                while (pending := self._pending.get(key)) is not None:
+                    if self._blocked(pending):
+                        await self._wait_for_change()
+                        continue
+                    # Not waited for while blocked, so the command going
+                    # first can get a slot
+                    async with self._slot():
+                        if self._pending.get(key) is pending and not self._blocked(pending):
+                            del self._pending[key]
+                            await self._send_pending(key, pending)
+                            break
+        finally:
+            self._workers.pop(key, None)
+
+    async def _send_pending(self, key: Hashable, pending: _Pending[_T]) -> None:
+        """Send a command and report its outcome to its callers."""
+        self._busy |= pending.covers
+        try:
+            await self._send(key, pending.intent)
+        except asyncio.CancelledError:
+            _resolve(pending.waiters, cancel=True)
+            raise
+        except Exception as err:  # Reported to every caller of this intent
+            _resolve(pending.waiters, error=err)
+        else:
+            _resolve(pending.waiters)
+        finally:
+            self._busy -= pending.covers
+            self._notify()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the workers; pending callers are cancelled too."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for pending in self._pending.values():
+            _resolve(pending.waiters, cancel=True)
+        self._pending.clear()
+
+
+def _resolve(
+    waiters: list[asyncio.Future[None]],
+    error: BaseException | None = None,
+    cancel: bool = False,
+) -> None:
+    """Complete the futures of callers still waiting."""
+    for waiter in waiters:
+        if waiter.done():
+            continue
+        if cancel:
+            waiter.cancel()
+        elif error is not None:
+            waiter.set_exception(error)
+        else:
+            waiter.set_result(None)
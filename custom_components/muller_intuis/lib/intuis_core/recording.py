@@ -0,0 +1,223 @@
+"""Record and replay of Muller Intuis API traffic.
+
+``TrafficRecorder`` appends every API request/response handled by
+``MullerIntuisApiClient`` to a JSON-lines file, with credentials and tokens
+redacted. ``ReplaySession`` implements the subset of ``aiohttp.ClientSession``
+used by the client and serves those recordings back, so parsing and entity
+updates can be profiled offline and deterministically.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from typing import Any
+from urllib.parse import urlsplit
+
+_LOGGER = logging.getLogger(__name__)
+
+REDACTED = "**REDACTED**"
+REDACTED_KEYS = frozenset(
+    {
+        "access_token",
+        "refresh_token",
+        "client_id",
+        "client_secret",
+        "username",
+        "password",
+        "email",
+    }
+)
+
+# Answer served for token requests: recordings never contain real tokens
+REPLAY_TOKEN_RESPONSE = {
+    "access_token": "replay-access-token",
+    "refresh_token": "replay-refresh-token",
+    "expires_in": 10800,
+}
+
+
+def redact(data: Any) -> Any:
+    """Return a copy of ``data`` with credentials and tokens replaced."""
+    if isinstance(data, dict):
+        return {
+            key: REDACTED if key in REDACTED_KEYS else redact(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [redact(item) for item in data]
+    return data
+
+
+class TrafficRecorder:
+    """Append API exchanges to a JSON-lines file.
+
+    Lines are buffered and written from the executor so recording never
+    blocks the event loop.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the recorder."""
+        self.path = path
+        self._started = time.monotonic()
+        self._buffer: list[str] = []
+        self._flush_task: asyncio.Task | None = None
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        status: int,
+        body: bytes,
+        elapsed: float,
+    ) -> None:
+        """Record one exchange."""
+        try:
+            decoded: Any = redact(json.loads(body))
+            key = "json"
+        except ValueError:
+            decoded = body.decode("utf-8", errors="replace")
+            key = "text"
+
+        entry = {
+            "t": round(time.monotonic() - self._started, 3),
+            "method": method,
+            "path": urlsplit(url).path,
+            "params": redact(params) if params else None,
+            "status": status,
+            "elapsed": round(elapsed, 4),
+            key: decoded,
+        }
+        self._buffer.append(json.dumps(entry, separators=(",", ":"), ensure_ascii=False))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        """Write buffered lines until the buffer is empty."""
+        loop = asyncio.get_running_loop()
+        while self._buffer:
+            lines, self._buffer = self._buffer, []
+            await loop.run_in_executor(None, self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines to the recording file."""
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    async def async_close(self) -> None:
+        """Flush pending lines."""
+        if self._flush_task is not None:
+            await self._flush_task
+        await self._async_flush()
+
+
+class ReplayExhausted(RuntimeError):
+    """Error raised when no recording is left for a request."""
+
+
+class ReplayResponse:
+    """Recorded response exposing the ``aiohttp.ClientResponse`` read API."""
+
+    def __init__(self, status: int, body: bytes) -> None:
+        """Initialize the response."""
+        self.status = status
+        self._body = body
+
+    async def read(self) -> bytes:
+        """Return the raw body."""
+        return self._body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        """Return the body as text."""
+        return self._body.decode(encoding)
+
+    async def json(self, **kwargs: Any) -> Any:
+        """Decode the body on every call, like aiohttp does."""
+        return json.loads(self._body)
+
+
+class _ReplayRequest:
+    """Async context manager returned by ``ReplaySession.request``."""
+
+    def __init__(self, response: ReplayResponse, delay: float) -> None:
+        self._response = response
+        self._delay = delay
+
+    async def __aenter__(self) -> ReplayResponse:
+        if self._delay > 0:
+            await asyncio.sleep(self._delay)
+        return self._response
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class ReplaySession:
+    """Serve recorded exchanges in place of an ``aiohttp.ClientSession``.
+
+    Recordings are matched by method and URL path, in file order. ``speed``
+    scales the recorded latency: 1 replays original timing, 10 is ten times
+    faster and 0 answers immediately. With ``loop`` enabled, exhausted
+    recordings start over, which suits long benchmarks.
+    """
+
+    def __init__(
+        self,
+        entries: list[dict[str, Any]],
+        speed: float = 1.0,
+        loop: bool = False,
+    ) -> None:
+        """Initialize the session."""
+        self.speed = speed
+        self.loop = loop
+        self.closed = False
+        self._recorded: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for entry in entries:
+            self._recorded[(entry["method"], entry["path"])].append(entry)
+        self._pending = {key: deque(value) for key, value in self._recorded.items()}
+
+    @classmethod
+    def from_file(cls, path: str, speed: float = 1.0, loop: bool = False) -> ReplaySession:
+        """Load a recording written by ``TrafficRecorder`` (blocking)."""
+        with open(path, encoding="utf-8") as file:
+            entries = [json.loads(line) for line in file if line.strip()]
+        _LOGGER.debug("Loaded %d recorded exchanges from %s", len(entries), path)
+        return cls(entries, speed, loop)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _ReplayRequest:
+        """Return the next recorded response for this request."""
+        path = urlsplit(url).path
+        if path.endswith("/oauth2/token"):
+            body = json.dumps(REPLAY_TOKEN_RESPONSE).encode()
+            return _ReplayRequest(ReplayResponse(200, body), 0)
+
+        key = (method.upper(), path)
+        pending = self._pending.get(key)
+        if not pending:
+            if not self.loop or not self._recorded.get(key):
+                raise ReplayExhausted(f"No recording left for {method} {path}")
+            pending = self._pending[key] = deque(self._recorded[key])
+
+        entry = pending.popleft()
+        if "json" in entry:
+            body = json.dumps(entry["json"], separators=(",", ":")).encode()
+        else:
+            body = entry.get("text", "").encode()
+        delay = entry.get("elapsed", 0) / self.speed if self.speed > 0 else 0
+        return _ReplayRequest(ReplayResponse(entry["status"], body), delay)
+
+    def get(self, url: str, **kwargs: Any) -> _ReplayRequest:
+        """Replay a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> _ReplayRequest:
+        """Replay a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the session."""
+        self.closed = True
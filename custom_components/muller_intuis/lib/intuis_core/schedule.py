@@ -0,0 +1,90 @@
+"""Heating schedule helpers."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from .const import (
+    MINUTES_PER_DAY,
+    MINUTES_PER_WEEK,
+    MODE_SCHEDULE,
+    SCHEDULE_TYPE_THERM,
+)
+from .models import Schedule
+
+
+def schedule_name(schedule: Schedule) -> str:
+    """Return the display name of a schedule."""
+    return schedule.get("name", f"Planning {schedule.get('id')}")
+
+
+def therm_schedules(schedules: list[Schedule]) -> list[Schedule]:
+    """Return the heating schedules."""
+    return [s for s in schedules if s.get("type") == SCHEDULE_TYPE_THERM]
+
+
+def active_schedule(schedules: list[Schedule]) -> Schedule | None:
+    """Return the selected heating schedule, or None."""
+    for schedule in therm_schedules(schedules):
+        if schedule.get("selected", False):
+            return schedule
+    return None
+
+
+def find_schedule(schedules: list[Schedule], name: str) -> Schedule | None:
+    """Return the heating schedule called ``name``, or None."""
+    for schedule in therm_schedules(schedules):
+        if schedule.get("name") == name:
+            return schedule
+    return None
+
+
+def next_timetable_change(schedule: Schedule, now: datetime) -> datetime | None:
+    """Return when the schedule next switches zone after ``now``, or None.
+
+    ``now`` must be aware and in the home's time zone: ``m_offset`` counts
+    wall clock minutes from Monday 00:00. Consecutive entries of the same
+    zone are not a change.
+    """
+    timetable = sorted(schedule.get("timetable", []), key=lambda entry: entry["m_offset"])
+    changes = [
+        entry["m_offset"]
+        for index, entry in enumerate(timetable)
+        if entry["zone_id"] != timetable[index - 1]["zone_id"]
+    ]
+    if not changes:
+        return None
+
+    minute = now.weekday() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+    offset = next(
+        (offset for offset in changes if offset > minute), changes[0] + MINUTES_PER_WEEK
+    )
+    # Wall clock arithmetic: the zone offset is recomputed for the result
+    return now.replace(second=0, microsecond=0) + timedelta(minutes=offset - minute)
+
+
+def next_expected_change(
+    status: dict[str, Any], schedule: Schedule | None, now: datetime
+) -> float | None:
+    """Return the timestamp of the next expected setpoint change, or None.
+
+    Candidates are the end of the home mode (``therm_mode_endtime``), the
+    end of room overrides (``therm_setpoint_end_time``) and, while the home
+    follows its schedule, the next timetable change.
+    """
+    timestamp = now.timestamp()
+    candidates = [
+        end_time
+        for end_time in (
+            status.get("therm_mode_endtime"),
+            *(room.get("therm_setpoint_end_time") for room in status.get("rooms", [])),
+        )
+        if end_time and end_time > timestamp
+    ]
+
+    if schedule is not None and status.get("therm_mode", MODE_SCHEDULE) == MODE_SCHEDULE:
+        change = next_timetable_change(schedule, now)
+        if change is not None:
+            candidates.append(change.timestamp())
+
+    return min(candidates, default=None)
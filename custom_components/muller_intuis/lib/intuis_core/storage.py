@@ -0,0 +1,66 @@
+"""Pluggable token storage for the Muller Intuitiv API client."""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import Any, Protocol
+
+
+class TokenStore(Protocol):
+    """Persist an account's tokens.
+
+    Home Assistant's ``helpers.storage.Store`` satisfies this protocol.
+    """
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the saved tokens, or None."""
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        """Save the tokens."""
+
+
+class MemoryTokenStore:
+    """Keep tokens in memory for the lifetime of the process."""
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self._data: dict[str, Any] | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the saved tokens, or None."""
+        return self._data
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        """Save the tokens."""
+        self._data = dict(data)
+
+
+class JsonFileTokenStore:
+    """Keep tokens in a JSON file, read and written from the executor."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the store."""
+        self.path = path
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the saved tokens, or None."""
+        return await asyncio.get_running_loop().run_in_executor(None, self._load)
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        """Save the tokens."""
+        await asyncio.get_running_loop().run_in_executor(None, self._save, data)
+
+    def _load(self) -> dict[str, Any] | None:
+        """Read the file."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _save(self, data: dict[str, Any]) -> None:
+        """Write the file, readable by the owner only."""
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file)
@@ -0,0 +1,56 @@
+"""Prometheus metrics endpoint for Muller Intuis Connect."""
+from __future__ import annotations
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, METRICS_URL
+from .lib.intuis_core.metrics import CONTENT_TYPE, HomeMetrics, render_prometheus
+
+
+class MullerIntuisMetricsView(HomeAssistantView):
+    """Serve the room telemetry and request counters of every home.
+
+    The rendering comes from the coordinator snapshots only and is cached
+    until a refresh or an API request changes them, so scrapes never reach
+    the API.
+    """
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+        self._generation: tuple | None = None
+        self._body = b""
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics in Prometheus text format."""
+        coordinators = [
+            entry_data["coordinator"]
+            for entry_data in self.hass.data.get(DOMAIN, {}).values()
+        ]
+        generation = tuple(
+            (
+                coordinator.home_id,
+                coordinator.generation,
+                coordinator.last_update_success,
+                coordinator.api_client.metrics.generation,
+            )
+            for coordinator in coordinators
+        )
+        if generation != self._generation:
+            self._body = render_prometheus(
+                HomeMetrics(
+                    coordinator.home_id,
+                    coordinator.data.get("status", {}) if coordinator.data else {},
+                    coordinator.api_client.metrics,
+                    coordinator.last_update_success,
+                )
+                for coordinator in coordinators
+            ).encode()
+            self._generation = generation
+        return web.Response(body=self._body, headers={"Content-Type": CONTENT_TYPE})
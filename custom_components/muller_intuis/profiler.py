@@ -0,0 +1,144 @@
+"""On-demand profiling of coordinator refreshes and entity state writes."""
+from __future__ import annotations
+
+import cProfile
+import logging
+import pstats
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+try:
+    from pyprof2calltree import convert as convert_to_callgrind
+except ImportError:
+    convert_to_callgrind = None
+
+
+class RefreshProfiler:
+    """Run cProfile over the next N refreshes, counted across all coordinators.
+
+    A single profiler is shared by all config entries because only one
+    cProfile instance can be active at a time: N is one total, so with
+    several homes each refresh of any of them counts. A refresh counts once
+    when its fetch ends, whatever the outcome; the stats are saved once the
+    entity state writes that follow the last one are done. When idle,
+    ``active`` and ``profiling`` are the only cost paid on the refresh path.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the profiler."""
+        self._hass = hass
+        self.remaining = 0
+        self._profile: cProfile.Profile | None = None
+        self._depth = 0
+        self._path: str | None = None
+        self._ending = False  # Last refresh counted, save once its blocks end
+
+    @property
+    def active(self) -> bool:
+        """Return True while refreshes are left to profile."""
+        return self.remaining > 0
+
+    @property
+    def profiling(self) -> bool:
+        """Return True until the stats are saved, state writes included."""
+        return self._profile is not None
+
+    def start(self, refreshes: int, path: str) -> None:
+        """Profile the next ``refreshes`` refreshes; stats go to ``path``."""
+        if self._profile is not None:
+            raise HomeAssistantError(
+                f"Profiling already running, {self.remaining} refreshes left"
+            )
+        profile = cProfile.Profile()
+        try:
+            # Fails while another profiler runs, e.g. the Profiler integration
+            profile.enable()
+        except ValueError as err:
+            raise HomeAssistantError(f"Another profiler is running: {err}") from err
+        profile.disable()
+        self.remaining = refreshes
+        self._profile = profile
+        self._path = path
+        _LOGGER.info("Profiling the next %d refreshes", refreshes)
+
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        """Enable profiling for the enclosed block; nested blocks are merged.
+
+        cProfile follows the thread, so time the event loop spends on other
+        tasks while the block is suspended is attributed to them.
+        """
+        if self._profile is None:
+            yield
+            return
+
+        profile = self._profile
+        if self._depth == 0:
+            try:
+                profile.enable()
+            except ValueError as err:
+                # Another profiler started since: give up rather than fail the refresh
+                _LOGGER.warning("Profiling abandoned, another profiler is running: %s", err)
+                self._profile = self._path = None
+                self.remaining = 0
+                self._ending = False
+                yield
+                return
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                profile.disable()
+                if self._ending and self._profile is profile:
+                    self._finish()
+
+    def refresh_done(self) -> None:
+        """Count an ended refresh; after the last one, save the stats soon.
+
+        The coordinator updates its entities right after the fetch, in the
+        same task, so saving from the next loop iteration includes them.
+        """
+        if not self.active:
+            return
+        self.remaining -= 1
+        if not self.remaining:
+            self._hass.loop.call_soon(self._end)
+
+    def _end(self) -> None:
+        """Save the stats now, or once the profiled blocks still open end."""
+        if self._profile is None:
+            return
+        self._ending = True
+        # A refresh of another entry may still be inside a profiled block
+        if not self._depth:
+            self._finish()
+
+    def _finish(self) -> None:
+        """Stop collecting and save the stats in the background."""
+        profile, path = self._profile, self._path
+        self._profile = self._path = None
+        self._ending = False
+        self._hass.async_create_task(self._async_save(profile, path))
+
+    async def _async_save(self, profile: cProfile.Profile, path: str) -> None:
+        """Save the stats from the executor, logging failures."""
+        try:
+            await self._hass.async_add_executor_job(self._save, profile, path)
+        except Exception:  # Nothing else would report it
+            _LOGGER.exception("Could not save profiling results to %s", path)
+
+    @staticmethod
+    def _save(profile: cProfile.Profile, path: str) -> None:
+        """Write pstats output, plus callgrind output when pyprof2calltree is installed."""
+        stats = pstats.Stats(profile)
+        stats.dump_stats(f"{path}.prof")
+        if convert_to_callgrind is not None:
+            convert_to_callgrind(stats, f"{path}.callgrind")
+        _LOGGER.info("Profiling results saved to %s.prof", path)
@@ -7,10 +7,17 @@ from typing import Any
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .lib.intuis_core import IntuisError
+from .lib.intuis_core.schedule import (
+    find_schedule,
+    schedule_name,
+    therm_schedules,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,9 +34,7 @@ async def async_setup_entry(
     status = coordinator.data.get("status", {})
     schedules = status.get("schedules", [])
     
-    therm_schedules = [s for s in schedules if s.get("type") == "therm"]
-    
-    if therm_schedules:
+    if therm_schedules(schedules):
         entities = [MullerIntuisScheduleSelect(coordinator, api_client)]
         async_add_entities(entities)
         _LOGGER.info("Select platform setup completed with schedule selector")
@@ -68,9 +73,7 @@ class MullerIntuisScheduleSelect(CoordinatorEntity, SelectEntity):
         status = self.coordinator.data.get("status", {})
         schedules = status.get("schedules", [])
         
-        therm_schedules = [s for s in schedules if s.get("type") == "therm"]
-        
-        return [s.get("name", f"Planning {s.get('id')}") for s in therm_schedules]
+        return [schedule_name(s) for s in therm_schedules(schedules)]
 
     @property
     def current_option(self) -> str | None:
@@ -78,13 +81,13 @@ class MullerIntuisScheduleSelect(CoordinatorEntity, SelectEntity):
         status = self.coordinator.data.get("status", {})
         schedules = status.get("schedules", [])
         
-        for schedule in schedules:
-            if schedule.get("type") == "therm" and schedule.get("selected", False):
-                return schedule.get("name", f"Planning {schedule.get('id')}")
+        schedule = status.get("active_schedule")
+        if schedule:
+            return schedule_name(schedule)
         
-        therm_schedules = [s for s in schedules if s.get("type") == "therm"]
-        if therm_schedules:
-            return therm_schedules[0].get("name", f"Planning {therm_schedules[0].get('id')}")
+        candidates = therm_schedules(schedules)
+        if candidates:
+            return schedule_name(candidates[0])
         
         return None
 
@@ -95,26 +98,17 @@ class MullerIntuisScheduleSelect(CoordinatorEntity, SelectEntity):
         status = self.coordinator.data.get("status", {})
         schedules = status.get("schedules", [])
         
-        _LOGGER.debug("Available schedules: %s", [s.get("name") for s in schedules if s.get("type") == "therm"])
-        
-        schedule_id = None
-        for schedule in schedules:
-            if schedule.get("type") == "therm":
-                sched_name = schedule.get("name")
-                _LOGGER.debug("Comparing '%s' with '%s'", sched_name, option)
-                if sched_name == option:
-                    schedule_id = schedule.get("id")
-                    break
+        schedule = find_schedule(schedules, option)
+        schedule_id = schedule.get("id") if schedule else None
         
         if not schedule_id:
             _LOGGER.error("Schedule not found: '%s'. Available: %s", 
-                         option, [s.get("name") for s in schedules if s.get("type") == "therm"])
+                         option, [s.get("name") for s in therm_schedules(schedules)])
             return
         
         try:
             _LOGGER.info("Switching to schedule ID: %s", schedule_id)
-            await self.api_client.switch_home_schedule(self._home_id, schedule_id)
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+            await self.coordinator.async_switch_schedule(schedule_id)
+        except IntuisError as err:
             _LOGGER.error("Error changing schedule: %s", err)
-            raise
+            raise HomeAssistantError(f"Error changing schedule: {err}") from err
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -14,11 +15,34 @@ from homeassistant.const import UnitOfTemperature, PERCENTAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, MODE_MANUAL
 
 _LOGGER = logging.getLogger(__name__)
 
+# (HomeAggregates attribute, name, unit, device class, icon)
+HOME_AGGREGATES = (
+    ("heating_demand", "Demande de chauffe totale", PERCENTAGE, None, "mdi:radiator"),
+    ("rooms_heating", "Pièces en chauffe", None, None, "mdi:fire"),
+    (
+        "mean_temperature",
+        "Température moyenne",
+        UnitOfTemperature.CELSIUS,
+        SensorDeviceClass.TEMPERATURE,
+        None,
+    ),
+    (
+        "min_temperature",
+        "Température minimale",
+        UnitOfTemperature.CELSIUS,
+        SensorDeviceClass.TEMPERATURE,
+        None,
+    ),
+    ("open_windows", "Fenêtres ouvertes", None, None, "mdi:window-open-variant"),
+    ("unreachable_rooms", "Pièces injoignables", None, None, "mdi:lan-disconnect"),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -36,6 +60,12 @@ async def async_setup_entry(
     
     rooms_map = {room["id"]: room for room in rooms_info}
     
+    # Home-level aggregates, on the heating system device
+    for key, name, unit, device_class, icon in HOME_AGGREGATES:
+        entities.append(
+            MullerIntuisHomeAggregateSensor(coordinator, key, name, unit, device_class, icon)
+        )
+
     for room_status in rooms_status:
         room_id = room_status.get("id")
         room_info = rooms_map.get(room_id, {})
@@ -45,6 +75,8 @@ async def async_setup_entry(
         entities.append(MullerIntuisTemperatureSensor(coordinator, room_data))
         # Heating power sensor
         entities.append(MullerIntuisHeatingPowerSensor(coordinator, room_data))
+        # End of the manual override
+        entities.append(MullerIntuisManualEndSensor(coordinator, room_data))
         
     async_add_entities(entities)
     _LOGGER.info("Sensor platform setup completed with %d entities", len(entities))
@@ -125,3 +157,67 @@ class MullerIntuisHeatingPowerSensor(MullerIntuisSensorBase):
         if room:
             return room.get("heating_power_request", 0)
         return None
+
+
+class MullerIntuisManualEndSensor(MullerIntuisSensorBase):
+    """End time of the manual override of a room."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(self, coordinator, room_data: dict[str, Any]) -> None:
+        """Initialize the manual override end sensor."""
+        super().__init__(coordinator, room_data, "manual_end_time", "Fin du mode manuel")
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the end of the manual override, if one is running."""
+        room = self._get_room_data()
+        if not room or room.get("therm_setpoint_mode") != MODE_MANUAL:
+            return None
+        end_time = room.get("therm_setpoint_end_time")
+        if not end_time:
+            return None
+        return dt_util.utc_from_timestamp(end_time)
+
+
+class MullerIntuisHomeAggregateSensor(CoordinatorEntity, SensorEntity):
+    """Home-level figure maintained by the coordinator across refreshes."""
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator,
+        key: str,
+        name: str,
+        unit: str | None,
+        device_class: SensorDeviceClass | None,
+        icon: str | None,
+    ) -> None:
+        """Initialize the aggregate sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        self._home_id = coordinator.home_id
+        self._attr_unique_id = f"{self._home_id}_{key}"
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        if icon:
+            self._attr_icon = icon
+
+    @property
+    def device_info(self):
+        """Return device info - same as home climate."""
+        return {
+            "identifiers": {(DOMAIN, f"{self._home_id}_home")},
+            "name": "Système de chauffage",
+            "manufacturer": "Muller Intuitiv",
+            "model": "Contrôle central",
+        }
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the aggregate value."""
+        return getattr(self.coordinator.aggregates, self._key)
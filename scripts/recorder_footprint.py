@@ -0,0 +1,110 @@
+"""Measure the recorder footprint of the Muller Intuis entities.
+
+Counts, per entity and per day, the state rows and the state attribute rows
+written to the Home Assistant database, with their size in bytes. Run it
+before and after an upgrade on the same install to compare:
+
+    python scripts/recorder_footprint.py --config /config --days 2
+
+Only the standard library is used; the database is opened read-only.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+DOMAIN = "muller_intuis"
+
+_STATES_QUERY = """
+SELECT m.entity_id, COUNT(*), COALESCE(SUM(LENGTH(s.state)), 0)
+FROM states s JOIN states_meta m ON m.metadata_id = s.metadata_id
+WHERE m.entity_id IN ({entities}) AND s.last_updated_ts >= ?
+GROUP BY m.entity_id
+"""
+
+# Attribute rows are shared by hash: only count those first used in the window
+_ATTRIBUTES_QUERY = """
+SELECT m.entity_id, COUNT(*), COALESCE(SUM(LENGTH(a.shared_attrs)), 0)
+FROM (
+    SELECT s.attributes_id, MIN(s.metadata_id) AS metadata_id,
+           MIN(s.last_updated_ts) AS first_used
+    FROM states s JOIN states_meta m ON m.metadata_id = s.metadata_id
+    WHERE m.entity_id IN ({entities}) AND s.attributes_id IS NOT NULL
+    GROUP BY s.attributes_id
+) f
+JOIN state_attributes a ON a.attributes_id = f.attributes_id
+JOIN states_meta m ON m.metadata_id = f.metadata_id
+WHERE f.first_used >= ?
+GROUP BY m.entity_id
+"""
+
+
+def integration_entities(config_dir: Path) -> list[str]:
+    """Return the entity ids registered by the integration."""
+    registry = json.loads(
+        (config_dir / ".storage" / "core.entity_registry").read_text(encoding="utf-8")
+    )
+    return sorted(
+        entity["entity_id"]
+        for entity in registry["data"]["entities"]
+        if entity.get("platform") == DOMAIN
+    )
+
+
+def measure(db_path: Path, entities: list[str], days: float) -> dict[str, list[int]]:
+    """Return ``entity_id -> [state rows, state bytes, attr rows, attr bytes]``."""
+    since = time.time() - days * 86400
+    placeholders = ", ".join("?" * len(entities))
+    footprint = {entity_id: [0, 0, 0, 0] for entity_id in entities}
+
+    with sqlite3.connect(f"file:{db_path}?mode=ro", uri=True) as conn:
+        for entity_id, rows, size in conn.execute(
+            _STATES_QUERY.format(entities=placeholders), (*entities, since)
+        ):
+            footprint[entity_id][0:2] = [rows, size]
+        for entity_id, rows, size in conn.execute(
+            _ATTRIBUTES_QUERY.format(entities=placeholders), (*entities, since)
+        ):
+            footprint[entity_id][2:4] = [rows, size]
+    return footprint
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print the per-day footprint of each entity and the total."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", type=Path, default=Path("/config"),
+                        help="Home Assistant configuration directory")
+    parser.add_argument("--db", type=Path,
+                        help="SQLite database (default: <config>/home-assistant_v2.db)")
+    parser.add_argument("--days", type=float, default=1.0,
+                        help="Measurement window, in days back from now")
+    args = parser.parse_args(argv)
+
+    entities = integration_entities(args.config)
+    if not entities:
+        print(f"No {DOMAIN} entity in the entity registry", file=sys.stderr)
+        return 1
+
+    footprint = measure(args.db or args.config / "home-assistant_v2.db", entities, args.days)
+
+    print(f"Per day, over the last {args.days:g} day(s):")
+    print(f"{'entity_id':<50} {'states':>8} {'bytes':>9} {'attrs':>7} {'bytes':>9}")
+    totals = [0, 0, 0, 0]
+    for entity_id, values in footprint.items():
+        per_day = [value / args.days for value in values]
+        totals = [total + value for total, value in zip(totals, per_day)]
+        print(f"{entity_id:<50} {per_day[0]:>8.0f} {per_day[1]:>9.0f} "
+              f"{per_day[2]:>7.0f} {per_day[3]:>9.0f}")
+    print(f"{'total':<50} {totals[0]:>8.0f} {totals[1]:>9.0f} "
+          f"{totals[2]:>7.0f} {totals[3]:>9.0f}")
+    print(f"Rows written per day: {totals[0] + totals[2]:.0f}, "
+          f"bytes: {totals[1] + totals[3]:.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""Soak benchmark: many refresh and write cycles, memory growth and loop lag.
+
+Drives the coordinator and every entity platform inside a bare Home Assistant
+instance, against a local stand-in for the cloud (a looping ``ReplaySession``
+fed with generated or recorded traffic), then reports:
+
+- tracemalloc growth between the end of the warm-up and the last cycle,
+  grouped by allocation site;
+- event loop lag percentiles, sampled by a task sleeping in the background.
+
+It exits with status 1 when the growth or the p99 lag exceeds its threshold.
+Needs Home Assistant installed; run from the repository root::
+
+    python scripts/soak_benchmark.py --rooms 30 --cycles 20000
+    python scripts/soak_benchmark.py --replay muller_intuis_traffic_xxx.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import array
+import asyncio
+import gc
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant import loader  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import device_registry as dr, entity_registry as er  # noqa: E402
+from homeassistant.helpers.entity_platform import EntityPlatform  # noqa: E402
+
+from custom_components.muller_intuis import (  # noqa: E402
+    binary_sensor,
+    climate,
+    select,
+    sensor,
+)
+from custom_components.muller_intuis.const import DOMAIN  # noqa: E402
+from custom_components.muller_intuis.coordinator import (  # noqa: E402
+    MullerIntuisDataUpdateCoordinator,
+)
+from custom_components.muller_intuis.lib.intuis_core import (  # noqa: E402
+    MullerIntuisApiClient,
+    ReplaySession,
+)
+
+PLATFORMS = (climate, sensor, binary_sensor, select)
+HOME_ID = "soak_home"
+ENTRY_ID = "soak"
+STATUS_VARIANTS = 16  # Distinct homestatus bodies served in turn
+LAG_INTERVAL = 0.005
+
+
+def generate_traffic(rooms: int) -> list[dict[str, Any]]:
+    """Return recorded-like exchanges for a home with ``rooms`` rooms.
+
+    Homestatus variants move temperatures and heating power, toggle windows
+    and start or end manual overrides, so entities really change state.
+    """
+    room_ids = [f"room_{index}" for index in range(rooms)]
+    zones = [
+        {
+            "id": zone_id,
+            "type": zone_type,
+            "name": name,
+            "rooms": [
+                {"id": room_id, "therm_setpoint_temperature": setpoint}
+                for room_id in room_ids
+            ],
+        }
+        for zone_id, zone_type, name, setpoint in ((0, 0, "Confort", 20), (1, 1, "Nuit", 17))
+    ]
+    timetable = [
+        {"zone_id": zone_id, "m_offset": day * 1440 + offset}
+        for day in range(7)
+        for zone_id, offset in ((1, 0), (0, 390), (1, 1320))
+    ]
+    homesdata = {
+        "status": "ok",
+        "body": {
+            "homes": [
+                {
+                    "id": HOME_ID,
+                    "name": "Soak",
+                    "timezone": "Europe/Paris",
+                    "rooms": [
+                        {"id": room_id, "name": f"Pièce {index}", "type": "livingroom"}
+                        for index, room_id in enumerate(room_ids)
+                    ],
+                    "modules": [
+                        {"id": f"module_{index}", "type": "NMH", "room_id": room_id}
+                        for index, room_id in enumerate(room_ids)
+                    ],
+                    "schedules": [
+                        {
+                            "id": f"schedule_{index}",
+                            "name": f"Planning {index}",
+                            "type": "therm",
+                            "selected": index == 0,
+                            "timetable": timetable,
+                            "zones": zones,
+                        }
+                        for index in range(3)
+                    ],
+                }
+            ]
+        },
+    }
+
+    exchanges = [{"method": "GET", "path": "/api/homesdata", "status": 200, "json": homesdata}]
+    for variant in range(STATUS_VARIANTS):
+        rooms_status = []
+        for index, room_id in enumerate(room_ids):
+            manual = (index + variant) % 5 == 0
+            rooms_status.append(
+                {
+                    "id": room_id,
+                    "reachable": (index + variant) % 23 != 0,
+                    "anticipating": (index + variant) % 7 == 0,
+                    "open_window": (index + variant) % 11 == 0,
+                    "heating_power_request": (index * 7 + variant * 13) % 101,
+                    "therm_measured_temperature": 18 + ((index + variant) % 8) / 2,
+                    "therm_setpoint_temperature": 21 if manual else 19,
+                    "therm_setpoint_mode": "manual" if manual else "home",
+                    "therm_setpoint_end_time": int(time.time()) + 3600 if manual else 0,
+                }
+            )
+        exchanges.append(
+            {
+                "method": "GET",
+                "path": "/api/homestatus",
+                "status": 200,
+                "json": {
+                    "status": "ok",
+                    "body": {"home": {"id": HOME_ID, "therm_mode": "schedule", "rooms": rooms_status}},
+                },
+            }
+        )
+    exchanges.append(
+        {"method": "POST", "path": "/syncapi/v1/setstate", "status": 200, "json": {"status": "ok"}}
+    )
+    return exchanges
+
+
+async def _sample_lag(lags: array.array, stop: asyncio.Event) -> None:
+    """Record how late the loop wakes this task up."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(LAG_INTERVAL)
+        lags.append(loop.time() - started - LAG_INTERVAL)
+
+
+async def _setup_entities(hass: HomeAssistant, coordinator, api_client) -> list[Any]:
+    """Run every platform setup and add its entities through an entity platform.
+
+    Entities go through the registries and state machine like in a running
+    instance; only the config entry is a stand-in.
+    """
+    loader.async_setup(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    hass.data.setdefault(DOMAIN, {})[ENTRY_ID] = {
+        "coordinator": coordinator,
+        "api_client": api_client,
+    }
+    entry = SimpleNamespace(entry_id=ENTRY_ID)
+    entities: list[Any] = []
+    for module in PLATFORMS:
+        platform_entities: list[Any] = []
+        await module.async_setup_entry(hass, entry, platform_entities.extend)
+        platform = EntityPlatform(
+            hass=hass,
+            logger=logging.getLogger(module.__name__),
+            domain=module.__name__.rsplit(".", 1)[-1],
+            platform_name=DOMAIN,
+            platform=None,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        await platform.async_add_entities(platform_entities)
+        entities.extend(platform_entities)
+    return entities
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run the soak and return the exit status."""
+    if args.replay:
+        session = ReplaySession.from_file(args.replay, speed=0, loop=True)
+    else:
+        session = ReplaySession(generate_traffic(args.rooms), speed=0, loop=True)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        api_client = MullerIntuisApiClient(session, "soak", "soak", "soak", "soak")
+        coordinator = MullerIntuisDataUpdateCoordinator(hass, api_client)
+        await coordinator.async_refresh()
+        if not coordinator.last_update_success:
+            print(f"Initial refresh failed: {coordinator.last_exception}")
+            return 1
+
+        entities = await _setup_entities(hass, coordinator, api_client)
+        room_climates = [
+            entity for entity in entities if isinstance(entity, climate.MullerIntuisRoomClimate)
+        ]
+        print(f"{len(entities)} entities, {len(room_climates)} rooms, {args.cycles} cycles")
+
+        # A float array: the samples are not tracked as separate objects
+        lags = array.array("d")
+        stop = asyncio.Event()
+        sampler = asyncio.create_task(_sample_lag(lags, stop))
+        tracemalloc.start(args.frames)
+        baseline = None
+        started = time.perf_counter()
+
+        for cycle in range(args.warmup + args.cycles):
+            if cycle == args.warmup:
+                gc.collect()
+                baseline = tracemalloc.take_snapshot()
+                del lags[:]
+            await coordinator.async_refresh()
+            if room_climates and cycle % args.write_every == 0:
+                entity = room_climates[cycle % len(room_climates)]
+                await entity.async_set_temperature(temperature=17 + cycle % 8)
+            # Let the sampler and deferred callbacks run between cycles
+            await asyncio.sleep(0)
+
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        final = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        stop.set()
+        await sampler
+        await coordinator.async_shutdown()
+        await hass.async_block_till_done()
+
+    # The lag samples are the benchmark's own growth
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__, all_frames=True),
+    ]
+    growth = final.filter_traces(filters).compare_to(baseline.filter_traces(filters), "traceback")
+    total_growth = sum(stat.size_diff for stat in growth)
+
+    print(f"{args.cycles} cycles in {elapsed:.1f}s ({args.cycles / elapsed:.0f} cycles/s)")
+    print(f"memory growth: {total_growth / 1024:+.1f} KiB, top allocation sites:")
+    for stat in growth[: args.top]:
+        frame = stat.traceback[0]
+        print(f"  {stat.size_diff / 1024:+9.1f} KiB {stat.count_diff:+7d} blocks  "
+              f"{frame.filename}:{frame.lineno}")
+
+    cuts = statistics.quantiles(lags, n=100) if len(lags) > 1 else [0.0] * 99
+    p99 = cuts[98] * 1000
+    print(f"loop lag p50: {cuts[49] * 1000:.2f} ms, p95: {cuts[94] * 1000:.2f} ms, "
+          f"p99: {p99:.2f} ms, max: {max(lags, default=0) * 1000:.2f} ms")
+
+    failures = []
+    if total_growth > args.max_growth_kib * 1024:
+        failures.append(f"memory growth above {args.max_growth_kib} KiB")
+    if p99 > args.max_lag_ms:
+        failures.append(f"p99 loop lag above {args.max_lag_ms} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse arguments and run the soak."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=20, help="rooms of the generated home")
+    parser.add_argument("--replay", help="serve this recording instead of generated traffic")
+    parser.add_argument("--cycles", type=int, default=5000, help="measured refresh cycles")
+    parser.add_argument("--warmup", type=int, default=200, help="cycles before the baseline")
+    parser.add_argument("--write-every", type=int, default=10,
+                        help="send a setpoint command every N cycles")
+    parser.add_argument("--max-growth-kib", type=float, default=512,
+                        help="fail above this memory growth")
+    parser.add_argument("--max-lag-ms", type=float, default=50, help="fail above this p99 lag")
+    parser.add_argument("--frames", type=int, default=1,
+                        help="traceback depth of an allocation site")
+    parser.add_argument("--top", type=int, default=10, help="allocation sites to print")
+    args = parser.parse_args(argv)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())